@@ -524,8 +524,10 @@ class AnimatedScrollView(AnimatedWidget):
         if self._last_mouse_pos and current_time > self._last_scroll_time:
             dt = current_time - self._last_scroll_time
             if dt > 0:
-                self._mouse_velocity.x = (current_pos.x - self._last_mouse_pos.x) / dt
-                self._mouse_velocity.y = (current_pos.y - self._last_mouse_pos.y) / dt
+                self._mouse_velocity = Point(
+                    (current_pos.x - self._last_mouse_pos.x) / dt,
+                    (current_pos.y - self._last_mouse_pos.y) / dt
+                )
         
         # Handle scroll bar dragging
         if self._v_scrollbar.is_dragging:
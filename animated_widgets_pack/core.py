@@ -280,6 +280,7 @@ class AnimatedWidget(ABC):
             target=self._animate_property_thread,
             args=(property_name, start_value, end_value, duration, easing_function)
         )
+        animation_thread.daemon = True
         animation_thread.do_run = True
         self._current_animations[property_name] = animation_thread
         animation_thread.start()
@@ -292,21 +293,31 @@ class AnimatedWidget(ABC):
         
         while getattr(threading.current_thread(), "do_run", True):
             elapsed = time.time() - start_time
-            progress = min(elapsed / duration, 1.0)
-            
-            # Apply easing function
-            eased_progress = easing_function(progress)
-            current_value = start_value + (end_value - start_value) * eased_progress
-            
-            # Update property
-            setattr(self, property_name, current_value)
-            self.update_appearance()
-            
-            if progress >= 1.0:
+            if self._animate_property_frame(property_name, start_value, end_value,
+                                            duration, easing_function, elapsed):
                 break
                 
             time.sleep(1/60)  # 60 FPS
     
+    def _animate_property_frame(self, property_name: str, start_value: float,
+                                end_value: float, duration: float,
+                                easing_function: Callable, elapsed: float) -> bool:
+        """
+        Apply one animation frame, `elapsed` seconds after the start
+        Returns True once the end value has been reached
+        """
+        progress = min(elapsed / duration, 1.0)
+        
+        # Apply easing function
+        eased_progress = easing_function(progress)
+        current_value = start_value + (end_value - start_value) * eased_progress
+        
+        # Update property
+        setattr(self, property_name, current_value)
+        self.update_appearance()
+        
+        return progress >= 1.0
+    
     def _ease_out_cubic(self, t: float) -> float:
         """Cubic-out easing function"""
         return 1 - (1 - t) ** 3
@@ -146,13 +146,13 @@ class SliderHandle:
         if self.slider.config_slider.orientation == SliderOrientation.HORIZONTAL:
             track_width = self.slider.config.width - self.slider.style.handle_size
             progress = (self.value - self.slider.min_value) / (self.slider.max_value - self.slider.min_value)
-            self.position.x = progress * track_width + self.slider.style.handle_size // 2
-            self.position.y = self.slider.config.height // 2
+            self.position = Point(progress * track_width + self.slider.style.handle_size // 2,
+                                  self.slider.config.height // 2)
         else:
             track_height = self.slider.config.height - self.slider.style.handle_size
             progress = (self.value - self.slider.min_value) / (self.slider.max_value - self.slider.min_value)
-            self.position.x = self.slider.config.width // 2
-            self.position.y = (1 - progress) * track_height + self.slider.style.handle_size // 2
+            self.position = Point(self.slider.config.width // 2,
+                                  (1 - progress) * track_height + self.slider.style.handle_size // 2)
     
     def update_value_from_position(self):
         """Update value based on current position"""
@@ -329,17 +329,17 @@ class SliderHandle:
         old_position = Point(self.position.x, self.position.y)
         
         if self.slider.config_slider.orientation == SliderOrientation.HORIZONTAL:
-            self.position.x = GeometryUtils.clamp(
+            self.position = Point(GeometryUtils.clamp(
                 new_position.x,
                 self.slider.style.handle_size // 2,
                 self.slider.config.width - self.slider.style.handle_size // 2
-            )
+            ), self.position.y)
         else:
-            self.position.y = GeometryUtils.clamp(
+            self.position = Point(self.position.x, GeometryUtils.clamp(
                 new_position.y,
                 self.slider.style.handle_size // 2,
                 self.slider.config.height - self.slider.style.handle_size // 2
-            )
+            ))
         
         # Update value
         old_value = self.value
@@ -6,11 +6,22 @@ import re
 import math
 from typing import Tuple, List, Optional, Union
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Callable
 import time
 
+# Numbers inside rgb()/rgba() color strings
+_RGB_NUMBER_RE = re.compile(r'\d+\.?\d*')
 
-@dataclass
+
+@lru_cache(maxsize=1024)
+def _to_hex(rgb: Tuple[int, int, int]) -> str:
+    """Format an RGB tuple as #rrggbb (cached, colors repeat a lot)"""
+    r, g, b = rgb
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+@dataclass(frozen=True)
 class Color:
     """RGBA color representation"""
     r: int
@@ -20,7 +31,7 @@ class Color:
     
     def to_hex(self) -> str:
         """Convert to hexadecimal format"""
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+        return _to_hex((self.r, self.g, self.b))
     
     def to_rgba_string(self) -> str:
         """Convert to rgba() string"""
@@ -61,7 +72,7 @@ class ColorUtils:
                 return Color(r, g, b)
             elif color_input.startswith('rgb'):
                 # Parse rgba(r, g, b, a) or rgb(r, g, b)
-                numbers = re.findall(r'\d+\.?\d*', color_input)
+                numbers = _RGB_NUMBER_RE.findall(color_input)
                 r, g, b = int(numbers[0]), int(numbers[1]), int(numbers[2])
                 a = float(numbers[3]) if len(numbers) > 3 else 1.0
                 return Color(r, g, b, a)
@@ -129,7 +140,7 @@ class ColorUtils:
         # Return black or white based on luminance
         return Color(0, 0, 0) if luminance > 0.5 else Color(255, 255, 255)
 
-@dataclass
+@dataclass(frozen=True)
 class Point:
     """2D Point"""
     x: float
@@ -143,7 +154,7 @@ class Point:
         """Create a new point translated by dx, dy"""
         return Point(self.x + dx, self.y + dy)
 
-@dataclass  
+@dataclass(frozen=True)
 class Rectangle:
     """Rectangle with position and dimensions"""
     x: float
@@ -243,8 +254,15 @@ class GeometryUtils:
 
     
     @staticmethod
-    def round_rectangle_path(rect: Rectangle, radius: float) -> List[Point]:
-        """Generate points for a rounded rectangle"""
+    def round_rectangle_path(rect: Rectangle, radius: float,
+                             segments: int = 8) -> List[Point]:
+        """
+        Generate points for a rounded rectangle
+        Each corner is approximated with `segments` segments (segments + 1 points)
+        """
+        if segments < 1:
+            raise ValueError(f"segments must be at least 1, got {segments}")
+        
         points = []
         
         # Limit radius
@@ -261,8 +279,6 @@ class GeometryUtils:
             ])
         else:
             # Rounded rectangle - approximation with segments
-            segments = 8  # Number of segments per corner
-            
             # Top-left corner
             for i in range(segments + 1):
                 angle = math.pi + i * (math.pi / 2) / segments
@@ -4,26 +4,137 @@ simple_example_2.py - Advanced example with new widgets
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 import sys
 import os
 
 # Add library path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-import tkinter as tk
-import time
-import threading
+from functools import partial
 from animated_widgets_pack.ToggleButton import AnimatedToggle, ToggleStyle
 from animated_widgets_pack.ProgressBar import AnimatedProgressBar, ProgressBarStyle
 from animated_widgets_pack.ScrollView import AnimatedScrollView, ScrollViewStyle, ScrollBarStyle
 from animated_widgets_pack.core import WidgetConfig
 from animated_widgets_pack.buttons import AnimatedButton, ButtonStyle
-from animated_widgets_pack.TextInput import AnimatedTextInput, TextInputStyle, TextInputType
-from animated_widgets_pack.CheckBox import AnimatedCheckbox, CheckboxStyle
 
-# في أعلى simple_example_2.py (قبل AdvancedDemo)
 
-import colorsys
+# Shared palette for the demo chrome
+WINDOW_BG = "#ecf0f1"
+SECTION_BG = "#ffffff"
+CARD_BG = "#f8f9fa"
+PANEL_BG = "#34495e"
+PRIMARY_FG = "#2c3e50"
+PANEL_FG = "#ecf0f1"
+MUTED_FG = "#7f8c8d"
+
+# Scroll view sections, in display order: (title, builder kind)
+SECTIONS = (
+    ("🔘 Commutateurs Animés", "toggle"),
+    ("📊 Barres de Progression Animées", "progress"),
+    ("🎛️ Boutons Avancés", "buttons"),
+    ("🎮 Éléments Interactifs", "interactive"),
+)
+
+# Labelled progress bars: (label, ProgressBarStyle options, initial value)
+PROGRESS_BARS = (
+    ("Téléchargement", {
+        "fill_color": "#3498db",
+        "fill_gradient_enabled": True,
+        "fill_gradient_colors": ["#3498db", "#2980b9"],
+        "pulse_enabled": True,
+        "show_text": True,
+        "text_format": "{value}%",
+    }, 65),
+    ("Installation", {
+        "fill_color": "#27ae60",
+        "stripes_enabled": True,
+        "stripe_color": "#ffffff",
+        "stripe_opacity": 0.3,
+        "show_text": True,
+        "text_format": "Étape {value}/100",
+    }, 45),
+    ("Traitement", {
+        "fill_gradient_enabled": True,
+        "fill_gradient_colors": ["#e74c3c", "#f39c12", "#f1c40f", "#27ae60"],
+        "glow_enabled": True,
+        "glow_color": "#f39c12",
+        "show_text": True,
+        "text_position": "outside",
+    }, 78),
+)
+
+# Toggle rows of the toggle section
+TOGGLE_CONFIGS = (
+    {
+        'name': 'Mode Sombre',
+        'style': ToggleStyle(
+            track_color_off="#95a5a6",
+            track_color_on="#2c3e50",
+            thumb_color_off="#ecf0f1",
+            thumb_color_on="#ffffff",
+            glow_enabled=True,
+            glow_color="#3498db"
+        )
+    },
+    {
+        'name': 'Notifications',
+        'style': ToggleStyle(
+            track_color_off="#e74c3c",
+            track_color_on="#27ae60",
+            bounce_effect=True,
+            show_labels=True,
+            label_on="ON",
+            label_off="OFF"
+        )
+    },
+    {
+        'name': 'Synchronisation',
+        'style': ToggleStyle(
+            track_color_off="#95a5a6",
+            track_color_on="#3498db",
+            track_width=80,
+            track_height=40,
+            thumb_size=35,
+            shadow_enabled=True
+        )
+    },
+)
+
+# Interactive palette buttons: (color, name)
+PALETTE_COLORS = (
+    ("#e74c3c", "Rouge"),
+    ("#3498db", "Bleu"),
+    ("#2ecc71", "Vert"),
+    ("#f39c12", "Orange"),
+    ("#9b59b6", "Violet"),
+    ("#1abc9c", "Turquoise"),
+)
+
+# Animation demo buttons: (label, AdvancedDemo method name)
+ANIMATIONS = (
+    ("Impulsion", "demo_pulse"),
+    ("Secousse", "demo_shake"),
+    ("Flash", "demo_flash"),
+    ("Rebond", "demo_bounce"),
+)
+
+# Control panel progress buttons: (label, increment)
+PROGRESS_STEPS = (("-10", -10), ("+10", 10), ("+25", 25), ("Complete", 100))
+
+# Buttons shown on each demo card: (label, color)
+CARD_ACTIONS = (
+    ("Action", "#3498db"),
+    ("Info", "#2ecc71"),
+    ("Alerte", "#e74c3c"),
+)
+
+# Fixed window size, also used to center the window without a geometry pass
+WINDOW_WIDTH = 1200
+WINDOW_HEIGHT = 800
+
+# Number of scrolling demo cards added after startup
+DEMO_CARD_COUNT = 5
 
 class ColorUtils:
     @staticmethod
@@ -35,7 +146,8 @@ class ColorUtils:
     @staticmethod
     def rgb_to_hex(rgb):
         """Convert RGB tuple (0-255) to hex string (#RRGGBB)."""
-        return "#{:02x}{:02x}{:02x}".format(*rgb)
+        r, g, b = rgb
+        return f"#{r:02x}{g:02x}{b:02x}"
 
     @staticmethod
     def darken_color(hex_color, factor=0.1):
@@ -61,8 +173,19 @@ class AdvancedDemo:
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("AnimatedWidgetsPack - Widgets Avancés")
-        self.root.geometry("1200x800")
-        self.root.configure(bg="#ecf0f1")
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
+        self.root.configure(bg=WINDOW_BG)
+        
+        # Defaults inherited by every child widget that doesn't override them
+        self.root.option_add("*Background", WINDOW_BG)
+        self.root.option_add("*Label.foreground", PRIMARY_FG)
+        
+        # Shared fonts (parsed once by Tk, reused by every label)
+        self._font_header = tkfont.Font(family="Arial", size=18, weight="bold")
+        self._font_title = tkfont.Font(family="Arial", size=14, weight="bold")
+        self._font_card_title = tkfont.Font(family="Arial", size=12, weight="bold")
+        self._font_body = tkfont.Font(family="Arial", size=11)
+        self._font_small = tkfont.Font(family="Arial", size=10)
         
         # Center window
         self.center_window()
@@ -70,14 +193,18 @@ class AdvancedDemo:
         # Current values for demo
         self.progress_value = 0
         self.toggle_states = {}
+        self._progress_bars = []
+        self._progress_sync_pending = False
+        
+        # Echo status messages to the console only when AWP_VERBOSE=1
+        self._verbose = os.environ.get("AWP_VERBOSE") == "1"
         
         self.create_widgets()
     
     def center_window(self):
         """Center window on screen"""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
+        # The size is fixed, so there is no need to flush geometry to read it back
+        width, height = WINDOW_WIDTH, WINDOW_HEIGHT
         pos_x = (self.root.winfo_screenwidth() // 2) - (width // 2)
         pos_y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f"{width}x{height}+{pos_x}+{pos_y}")
@@ -89,9 +216,7 @@ class AdvancedDemo:
         title = tk.Label(
             self.root,
             text="🎨 AnimatedWidgetsPack - Widgets Avancés",
-            font=("Arial", 18, "bold"),
-            bg="#ecf0f1",
-            fg="#2c3e50"
+            font=self._font_header
         )
         title.pack(pady=20)
         
@@ -137,92 +262,51 @@ class AdvancedDemo:
     
     def populate_scroll_content(self):
         """Add content to the scroll view"""
+        builders = {
+            "toggle": self.create_toggle_section,
+            "progress": self.create_progress_section,
+            "buttons": self.create_advanced_buttons_section,
+            "interactive": self.create_interactive_section,
+        }
         
-        # Section 1: Toggle Switches
-        self.create_toggle_section()
-        
-        # Section 2: Progress Bars
-        self.create_progress_section()
-        
-        # Section 3: Advanced Buttons
-        self.create_advanced_buttons_section()
-        
-        # Section 4: Interactive Elements
-        self.create_interactive_section()
+        for title, kind in SECTIONS:
+            builders[kind](self._build_section(title))
         
         # Add some spacing at the bottom
-        spacer = tk.Frame(self.scroll_view._content_frame, height=100, bg="#ffffff")
+        spacer = tk.Frame(self.scroll_view._content_frame, height=100, bg=SECTION_BG)
         self.scroll_view.add_widget(spacer, fill="x", pady=20)
     
-    def create_toggle_section(self):
-        """Create toggle switches section"""
-        # Section title
-        section_frame = tk.Frame(self.scroll_view._content_frame, bg="#ffffff")
+    def _build_section(self, title_text):
+        """Create a titled section in the scroll view and return its container"""
+        section_frame = tk.Frame(self.scroll_view._content_frame, bg=SECTION_BG)
         self.scroll_view.add_widget(section_frame, fill="x", pady=10)
         
         title = tk.Label(
             section_frame,
-            text="🔘 Commutateurs Animés",
-            font=("Arial", 14, "bold"),
-            bg="#ffffff",
-            fg="#2c3e50"
+            text=title_text,
+            font=self._font_title,
+            bg=SECTION_BG
         )
         title.pack(anchor="w")
         
-        # Toggle container
-        toggle_frame = tk.Frame(self.scroll_view._content_frame, bg="#f8f9fa", relief="raised", bd=1)
-        self.scroll_view.add_widget(toggle_frame, fill="x", pady=10, padx=20)
-        
-        # Create different toggle styles
-        toggle_configs = [
-            {
-                'name': 'Mode Sombre',
-                'style': ToggleStyle(
-                    track_color_off="#95a5a6",
-                    track_color_on="#2c3e50",
-                    thumb_color_off="#ecf0f1",
-                    thumb_color_on="#ffffff",
-                    glow_enabled=True,
-                    glow_color="#3498db"
-                )
-            },
-            {
-                'name': 'Notifications',
-                'style': ToggleStyle(
-                    track_color_off="#e74c3c",
-                    track_color_on="#27ae60",
-                    bounce_effect=True,
-                    show_labels=True,
-                    label_on="ON",
-                    label_off="OFF"
-                )
-            },
-            {
-                'name': 'Synchronisation',
-                'style': ToggleStyle(
-                    track_color_off="#95a5a6",
-                    track_color_on="#3498db",
-                    track_width=80,
-                    track_height=40,
-                    thumb_size=35,
-                    shadow_enabled=True
-                )
-            }
-        ]
+        container = tk.Frame(self.scroll_view._content_frame, bg=CARD_BG, relief="raised", bd=1)
+        self.scroll_view.add_widget(container, fill="x", pady=10, padx=20)
+        return container
+    
+    def create_toggle_section(self, toggle_frame):
+        """Create toggle switches section"""
+        # Labels on the left, toggles on the right, laid out on one grid
+        toggle_frame.columnconfigure(0, weight=1)
         
-        for i, config in enumerate(toggle_configs):
-            row_frame = tk.Frame(toggle_frame, bg="#f8f9fa")
-            row_frame.pack(fill="x", pady=10, padx=20)
-            
+        for i, config in enumerate(TOGGLE_CONFIGS):
             # Label
             label = tk.Label(
-                row_frame,
+                toggle_frame,
                 text=config['name'],
-                font=("Arial", 11),
-                bg="#f8f9fa",
-                fg="#2c3e50"
+                font=self._font_body,
+                bg=CARD_BG
             )
-            label.pack(side="left")
+            label.grid(row=i, column=0, sticky="w", padx=20, pady=10)
             
             # Toggle switch
             toggle = AnimatedToggle(
@@ -230,87 +314,33 @@ class AdvancedDemo:
                 style=config['style']
             )
             
-            toggle_widget = toggle.render(row_frame, "tkinter")
-            toggle_widget.pack(side="right")
+            toggle_widget = toggle.render(toggle_frame, "tkinter")
+            toggle_widget.grid(row=i, column=1, sticky="e", padx=20, pady=10)
             
             # Store reference and bind callback
             self.toggle_states[config['name']] = toggle
-            toggle.on_toggle(lambda state, name=config['name']: self.on_toggle_changed(name, state))
+            toggle.on_toggle(partial(self.on_toggle_changed, config['name']))
     
-    def create_progress_section(self):
+    def create_progress_section(self, progress_frame):
         """Create progress bars section"""
-        # Section title
-        section_frame = tk.Frame(self.scroll_view._content_frame, bg="#ffffff")
-        self.scroll_view.add_widget(section_frame, fill="x", pady=10)
-        
-        title = tk.Label(
-            section_frame,
-            text="📊 Barres de Progression Animées",
-            font=("Arial", 14, "bold"),
-            bg="#ffffff",
-            fg="#2c3e50"
-        )
-        title.pack(anchor="w")
-        
-        # Progress container
-        progress_frame = tk.Frame(self.scroll_view._content_frame, bg="#f8f9fa", relief="raised", bd=1)
-        self.scroll_view.add_widget(progress_frame, fill="x", pady=10, padx=20)
-        
-        # Standard progress bar
-        self.create_progress_bar(
-            progress_frame,
-            "Téléchargement",
-            ProgressBarStyle(
-                fill_color="#3498db",
-                fill_gradient_enabled=True,
-                fill_gradient_colors=["#3498db", "#2980b9"],
-                pulse_enabled=True,
-                show_text=True,
-                text_format="{value}%"
-            ),
-            initial_value=65
-        )
-        
-        # Striped progress bar
-        self.create_progress_bar(
-            progress_frame,
-            "Installation",
-            ProgressBarStyle(
-                fill_color="#27ae60",
-                stripes_enabled=True,
-                stripe_color="#ffffff",
-                stripe_opacity=0.3,
-                show_text=True,
-                text_format="Étape {value}/100"
-            ),
-            initial_value=45
-        )
-        
-        # Gradient progress bar
-        self.create_progress_bar(
-            progress_frame,
-            "Traitement",
-            ProgressBarStyle(
-                fill_gradient_enabled=True,
-                fill_gradient_colors=["#e74c3c", "#f39c12", "#f1c40f", "#27ae60"],
-                glow_enabled=True,
-                glow_color="#f39c12",
-                show_text=True,
-                text_position="outside"
-            ),
-            initial_value=78
-        )
+        # Standard, striped and gradient progress bars
+        for label_text, style_options, initial_value in PROGRESS_BARS:
+            self.create_progress_bar(
+                progress_frame,
+                label_text,
+                ProgressBarStyle(**style_options),
+                initial_value=initial_value
+            )
         
         # Indeterminate progress bar
-        indeterminate_frame = tk.Frame(progress_frame, bg="#f8f9fa")
+        indeterminate_frame = tk.Frame(progress_frame, bg=CARD_BG)
         indeterminate_frame.pack(fill="x", pady=10, padx=20)
         
         ind_label = tk.Label(
             indeterminate_frame,
             text="Chargement...",
-            font=("Arial", 11),
-            bg="#f8f9fa",
-            fg="#2c3e50"
+            font=self._font_body,
+            bg=CARD_BG
         )
         ind_label.pack(anchor="w")
         
@@ -333,16 +363,15 @@ class AdvancedDemo:
     
     def create_progress_bar(self, parent, label_text, style, initial_value=0):
         """Helper to create a progress bar with label"""
-        container = tk.Frame(parent, bg="#f8f9fa")
+        container = tk.Frame(parent, bg=CARD_BG)
         container.pack(fill="x", pady=10, padx=20)
         
         # Label
         label = tk.Label(
             container,
             text=label_text,
-            font=("Arial", 11),
-            bg="#f8f9fa",
-            fg="#2c3e50"
+            font=self._font_body,
+            bg=CARD_BG
         )
         label.pack(anchor="w")
         
@@ -358,33 +387,17 @@ class AdvancedDemo:
         progress_widget = progress.render(container, "tkinter")
         progress_widget.pack(pady=5)
         
+        self._progress_bars.append(progress)
         return progress
     
-    def create_advanced_buttons_section(self):
+    def create_advanced_buttons_section(self, buttons_frame):
         """Create advanced buttons section"""
-        # Section title
-        section_frame = tk.Frame(self.scroll_view._content_frame, bg="#ffffff")
-        self.scroll_view.add_widget(section_frame, fill="x", pady=10)
-        
-        title = tk.Label(
-            section_frame,
-            text="🎛️ Boutons Avancés",
-            font=("Arial", 14, "bold"),
-            bg="#ffffff",
-            fg="#2c3e50"
-        )
-        title.pack(anchor="w")
-        
-        # Buttons container
-        buttons_frame = tk.Frame(self.scroll_view._content_frame, bg="#f8f9fa", relief="raised", bd=1)
-        self.scroll_view.add_widget(buttons_frame, fill="x", pady=10, padx=20)
-        
         # Create button grid
-        button_grid = tk.Frame(buttons_frame, bg="#f8f9fa")
+        button_grid = tk.Frame(buttons_frame, bg=CARD_BG)
         button_grid.pack(pady=20)
         
         # Row 1: Different styles
-        row1 = tk.Frame(button_grid, bg="#f8f9fa")
+        row1 = tk.Frame(button_grid, bg=CARD_BG)
         row1.pack(pady=10)
         
         # Gradient button
@@ -434,7 +447,7 @@ class AdvancedDemo:
         glass_btn.on_click(lambda: glass_btn.bounce_animation(0.6))
         
         # Row 2: Action buttons
-        row2 = tk.Frame(button_grid, bg="#f8f9fa")
+        row2 = tk.Frame(button_grid, bg=CARD_BG)
         row2.pack(pady=10)
         
         # Download button
@@ -468,25 +481,8 @@ class AdvancedDemo:
         self.download_btn = download_btn
         self.settings_btn = settings_btn
     
-    def create_interactive_section(self):
+    def create_interactive_section(self, interactive_frame):
         """Create interactive demo section"""
-        # Section title
-        section_frame = tk.Frame(self.scroll_view._content_frame, bg="#ffffff")
-        self.scroll_view.add_widget(section_frame, fill="x", pady=10)
-        
-        title = tk.Label(
-            section_frame,
-            text="🎮 Éléments Interactifs",
-            font=("Arial", 14, "bold"),
-            bg="#ffffff",
-            fg="#2c3e50"
-        )
-        title.pack(anchor="w")
-        
-        # Interactive container
-        interactive_frame = tk.Frame(self.scroll_view._content_frame, bg="#f8f9fa", relief="raised", bd=1)
-        self.scroll_view.add_widget(interactive_frame, fill="x", pady=10, padx=20)
-        
         # Create color palette demo
         self.create_color_palette_demo(interactive_frame)
         
@@ -495,34 +491,24 @@ class AdvancedDemo:
     
     def create_color_palette_demo(self, parent):
         """Create color palette demonstration"""
-        palette_frame = tk.Frame(parent, bg="#f8f9fa")
+        palette_frame = tk.Frame(parent, bg=CARD_BG)
         palette_frame.pack(fill="x", pady=15, padx=20)
         
         palette_label = tk.Label(
             palette_frame,
             text="Palette de Couleurs Interactive",
-            font=("Arial", 12, "bold"),
-            bg="#f8f9fa",
-            fg="#2c3e50"
+            font=self._font_card_title,
+            bg=CARD_BG
         )
         palette_label.pack(anchor="w", pady=(0, 10))
         
         # Color buttons
-        colors_frame = tk.Frame(palette_frame, bg="#f8f9fa")
+        colors_frame = tk.Frame(palette_frame, bg=CARD_BG)
         colors_frame.pack()
         
-        colors = [
-            ("#e74c3c", "Rouge"),
-            ("#3498db", "Bleu"),
-            ("#2ecc71", "Vert"),
-            ("#f39c12", "Orange"),
-            ("#9b59b6", "Violet"),
-            ("#1abc9c", "Turquoise")
-        ]
-        
         self.color_buttons = []
         
-        for i, (color, name) in enumerate(colors):
+        for i, (color, name) in enumerate(PALETTE_COLORS):
             color_btn = AnimatedButton(
                 name,
                 config=WidgetConfig(width=100, height=35, border_radius=8),
@@ -537,35 +523,28 @@ class AdvancedDemo:
             color_widget = color_btn.render(colors_frame, "tkinter")
             color_widget.grid(row=i//3, column=i%3, padx=5, pady=5)
             
-            color_btn.on_click(lambda c=color: self.change_theme_color(c))
+            color_btn.on_click(partial(self.change_theme_color, color))
             self.color_buttons.append(color_btn)
     
     def create_animation_demo(self, parent):
         """Create animation demonstration"""
-        anim_frame = tk.Frame(parent, bg="#f8f9fa")
+        anim_frame = tk.Frame(parent, bg=CARD_BG)
         anim_frame.pack(fill="x", pady=15, padx=20)
         
         anim_label = tk.Label(
             anim_frame,
             text="Démonstration d'Animations",
-            font=("Arial", 12, "bold"),
-            bg="#f8f9fa",
-            fg="#2c3e50"
+            font=self._font_card_title,
+            bg=CARD_BG
         )
         anim_label.pack(anchor="w", pady=(0, 10))
         
         # Animation control buttons
-        anim_controls = tk.Frame(anim_frame, bg="#f8f9fa")
+        anim_controls = tk.Frame(anim_frame, bg=CARD_BG)
         anim_controls.pack()
         
-        animations = [
-            ("Impulsion", self.demo_pulse),
-            ("Secousse", self.demo_shake),
-            ("Flash", self.demo_flash),
-            ("Rebond", self.demo_bounce)
-        ]
-        
-        for name, callback in animations:
+        for name, method_name in ANIMATIONS:
+            callback = getattr(self, method_name)
             anim_btn = AnimatedButton(
                 name,
                 config=WidgetConfig(width=120, height=35),
@@ -583,12 +562,12 @@ class AdvancedDemo:
     
     def create_control_panel(self):
         """Create control panel at bottom"""
-        control_frame = tk.Frame(self.root, bg="#34495e", height=80)
+        control_frame = tk.Frame(self.root, bg=PANEL_BG, height=80)
         control_frame.pack(fill="x", side="bottom")
         control_frame.pack_propagate(False)
         
         # Control buttons
-        controls_container = tk.Frame(control_frame, bg="#34495e")
+        controls_container = tk.Frame(control_frame, bg=PANEL_BG)
         controls_container.pack(expand=True)
         
         # Reset button
@@ -606,23 +585,23 @@ class AdvancedDemo:
         reset_btn.on_click(self.reset_demo)
         
         # Progress control
-        progress_control = tk.Frame(controls_container, bg="#34495e")
+        progress_control = tk.Frame(controls_container, bg=PANEL_BG)
         progress_control.pack(side="left", padx=20, pady=20)
         
         progress_label = tk.Label(
             progress_control,
             text="Contrôle du Progrès:",
-            font=("Arial", 10),
-            bg="#34495e",
-            fg="#ecf0f1"
+            font=self._font_small,
+            bg=PANEL_BG,
+            fg=PANEL_FG
         )
         progress_label.pack()
         
-        progress_buttons = tk.Frame(progress_control, bg="#34495e")
+        progress_buttons = tk.Frame(progress_control, bg=PANEL_BG)
         progress_buttons.pack()
         
         # Progress increment buttons
-        for label, increment in [("-10", -10), ("+10", 10), ("+25", 25), ("Complete", 100)]:
+        for label, increment in PROGRESS_STEPS:
             btn = AnimatedButton(
                 label,
                 config=WidgetConfig(width=60, height=30),
@@ -636,17 +615,17 @@ class AdvancedDemo:
             btn_widget.pack(side="left", padx=2)
             
             if label == "Complete":
-                btn.on_click(lambda: self.set_all_progress(100))
+                btn.on_click(partial(self.set_all_progress, 100))
             else:
-                btn.on_click(lambda inc=increment: self.increment_progress(inc))
+                btn.on_click(partial(self.increment_progress, increment))
         
         # Status display
         self.status_label = tk.Label(
             controls_container,
             text="Prêt",
-            font=("Arial", 12, "bold"),
-            bg="#34495e",
-            fg="#ecf0f1"
+            font=self._font_card_title,
+            bg=PANEL_BG,
+            fg=PANEL_FG
         )
         self.status_label.pack(side="right", padx=20, pady=20)
     
@@ -721,14 +700,26 @@ class AdvancedDemo:
         """Increment all progress bars"""
         self.progress_value = max(0, min(100, self.progress_value + amount))
         self.update_status(f"Progrès: {self.progress_value}%")
-        
-        # Update progress bars (in a real implementation, 
-        # you'd store references to all progress bars)
+        self._schedule_progress_sync()
     
     def set_all_progress(self, value):
         """Set all progress bars to specific value"""
         self.progress_value = value
         self.update_status(f"Progrès défini à: {value}%")
+        self._schedule_progress_sync()
+    
+    def _schedule_progress_sync(self):
+        """Push progress_value to the bars once the event loop is idle"""
+        # Several clicks before the next idle point collapse into one update
+        if not self._progress_sync_pending:
+            self._progress_sync_pending = True
+            self.root.after_idle(self._sync_progress_bars)
+    
+    def _sync_progress_bars(self):
+        """Apply the current progress value to every progress bar"""
+        self._progress_sync_pending = False
+        for progress in self._progress_bars:
+            progress.set_value(self.progress_value, animate=True)
     
     def apply_dark_theme(self):
         """Apply dark theme"""
@@ -750,6 +741,7 @@ class AdvancedDemo:
         
         # Reset progress
         self.progress_value = 0
+        self._schedule_progress_sync()
         
         # Flash reset button
         self.root.after(100, lambda: self.update_status("Prêt"))
@@ -757,76 +749,78 @@ class AdvancedDemo:
     def update_status(self, message):
         """Update status display"""
         self.status_label.configure(text=message)
-        print(f"[STATUS] {message}")  # Also log to console
+        if __debug__ and self._verbose:
+            print(f"[STATUS] {message}")  # Also log to console
     
     def run(self):
         """Start the application"""
         self.update_status("Application démarrée - Explorez les widgets!")
         
-        # Add some demo content to showcase scrolling
-        self.add_demo_content()
+        # Add some demo content to showcase scrolling once the main UI is painted
+        self.root.after_idle(self.add_demo_content)
         
         self.root.mainloop()
     
     def add_demo_content(self):
         """Add additional demo content for scrolling"""
-        # Add some cards to demonstrate scrolling
-        for i in range(5):
-            card_frame = tk.Frame(
-                self.scroll_view._content_frame, 
-                bg="#ffffff", 
-                relief="raised", 
-                bd=1
+        # Cards are built one at a time so the event loop keeps painting in between
+        self._add_card(0)
+    
+    def _add_card(self, i):
+        """Build demo card ``i`` and schedule the next one"""
+        card_frame = tk.Frame(
+            self.scroll_view._content_frame, 
+            bg=SECTION_BG, 
+            relief="raised", 
+            bd=1
+        )
+        self.scroll_view.add_widget(card_frame, fill="x", pady=10, padx=20)
+        
+        card_title = tk.Label(
+            card_frame,
+            text=f"📋 Carte de Démonstration #{i+1}",
+            font=self._font_card_title,
+            bg=SECTION_BG
+        )
+        card_title.pack(pady=10)
+        
+        card_content = tk.Label(
+            card_frame,
+            text=f"Ceci est le contenu de la carte {i+1}. "
+                 f"Cette section démontre les capacités de défilement "
+                 f"du ScrollView animé avec des barres de défilement personnalisées.",
+            font=self._font_small,
+            bg=SECTION_BG,
+            fg=MUTED_FG,
+            wraplength=700,
+            justify="left"
+        )
+        card_content.pack(pady=(0, 15), padx=20)
+        
+        # Add some interactive elements to each card
+        card_buttons = tk.Frame(card_frame, bg=SECTION_BG)
+        card_buttons.pack(pady=(0, 15))
+        
+        for btn_text, btn_color in CARD_ACTIONS:
+            card_btn = AnimatedButton(
+                btn_text,
+                config=WidgetConfig(width=80, height=30),
+                style=ButtonStyle(
+                    normal_color=btn_color,
+                    hover_color=ColorUtils.darken_color(btn_color, 0.1).to_hex(),
+                    pressed_color=ColorUtils.darken_color(btn_color, 0.2).to_hex()
+                )
             )
-            self.scroll_view.add_widget(card_frame, fill="x", pady=10, padx=20)
             
-            card_title = tk.Label(
-                card_frame,
-                text=f"📋 Carte de Démonstration #{i+1}",
-                font=("Arial", 12, "bold"),
-                bg="#ffffff",
-                fg="#2c3e50"
-            )
-            card_title.pack(pady=10)
+            card_btn_widget = card_btn.render(card_buttons, "tkinter")
+            card_btn_widget.pack(side="left", padx=5)
             
-            card_content = tk.Label(
-                card_frame,
-                text=f"Ceci est le contenu de la carte {i+1}. "
-                     f"Cette section démontre les capacités de défilement "
-                     f"du ScrollView animé avec des barres de défilement personnalisées.",
-                font=("Arial", 10),
-                bg="#ffffff",
-                fg="#7f8c8d",
-                wraplength=700,
-                justify="left"
+            card_btn.on_click(
+                partial(self.update_status, f"Carte {i+1}: {btn_text} cliqué")
             )
-            card_content.pack(pady=(0, 15), padx=20)
-            
-            # Add some interactive elements to each card
-            card_buttons = tk.Frame(card_frame, bg="#ffffff")
-            card_buttons.pack(pady=(0, 15))
-            
-            for j, (btn_text, btn_color) in enumerate([
-                ("Action", "#3498db"),
-                ("Info", "#2ecc71"), 
-                ("Alerte", "#e74c3c")
-            ]):
-                card_btn = AnimatedButton(
-                    btn_text,
-                    config=WidgetConfig(width=80, height=30),
-                    style=ButtonStyle(
-                        normal_color=btn_color,
-                        hover_color=ColorUtils.darken_color(btn_color, 0.1).to_hex(),
-                        pressed_color=ColorUtils.darken_color(btn_color, 0.2).to_hex()
-                    )
-                )
-                
-                card_btn_widget = card_btn.render(card_buttons, "tkinter")
-                card_btn_widget.pack(side="left", padx=5)
-                
-                card_btn.on_click(
-                    lambda t=btn_text, c=i+1: self.update_status(f"Carte {c}: {t} cliqué")
-                )
+        
+        if i + 1 < DEMO_CARD_COUNT:
+            self.root.after(15, self._add_card, i + 1)
 
 def main():
     """Main entry point"""
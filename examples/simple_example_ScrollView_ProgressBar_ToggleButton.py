@@ -5,9 +5,20 @@ Démontre l'utilisation basique de chaque widget
 """
 
 import tkinter as tk
-import threading
-import time
+from tkinter import font
+import collections
 import random
+import sys
+import traceback
+from dataclasses import replace
+from functools import partial
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
 
 from animated_widgets_pack.ToggleButton import AnimatedToggle, ToggleStyle
 from animated_widgets_pack.ProgressBar import AnimatedProgressBar, ProgressBarStyle
@@ -15,35 +26,98 @@ from animated_widgets_pack.ScrollView import AnimatedScrollView, ScrollViewStyle
 from animated_widgets_pack.core import WidgetConfig
 from animated_widgets_pack.buttons import AnimatedButton, ButtonStyle
 
+def _advance(vals, direction, step):
+    """Advance the auto-progress values one tick, bouncing between 0 and 100.
+    
+    vals[0] drives the first bar, vals[1] follows it at 1.2x. Returns the
+    direction for the next tick.
+    """
+    value = vals[0] + direction * step
+    if value >= 100:
+        value = 100.0
+        direction = -1
+    elif value <= 0:
+        value = 0.0
+        direction = 1
+    
+    vals[0] = value
+    vals[1] = min(100.0, value * 1.2)
+    return direction
+
+
+if njit is not None:
+    _advance = njit(cache=True)(_advance)
+
+
+_STATUS_FMT = "État: Mode Sombre: {}, Notifications: {}, Auto-save: {}"
+
+# Scroll list rows, drawn on a single canvas
+_ROW_W = 360
+_ROW_H = 52
+
+# Icons picked for items added with the "Ajouter" button
+_ADD_ICONS = ("⭐", "🎉", "🚀", "💎", "🌟", "🎁", "🏆", "🎯")
+
+# Common toggle geometry; each toggle derives its colors from it
+_TOGGLE_STYLE_BASE = ToggleStyle(track_width=50, track_height=25)
+
 class SimpleWidgetExample:
     """Exemple simple des nouveaux widgets"""
     
     def __init__(self):
         self.root = tk.Tk()
+        # Keep the window unmapped while the widget tree is built
+        self.root.withdraw()
         self.root.title("Exemple Simple - Nouveaux Widgets")
         self.root.geometry("900x700")
         self.root.configure(bg="#f0f2f5")
         
+        # Fonts shared by all labels (created once, after the Tk root exists)
+        self._f_title = font.Font(family="Arial", size=18, weight="bold")
+        self._f_hdr = font.Font(family="Arial", size=12, weight="bold")
+        self._f_lbl = font.Font(family="Arial", size=11)
+        self._f_bold_sm = font.Font(family="Arial", size=11, weight="bold")
+        self._f_sm = font.Font(family="Arial", size=10)
+        self._f_xs = font.Font(family="Arial", size=9)
+        
         # Variables
         self.auto_progress = False
-        self.progress_thread = None
+        self._after_id = None
+        self._prog_vals = None
+        self._last_dark = False
+        self._last_status = None
+        self._pending_prog = None
+        self._pending_scheduled = False
+        self.direction = 1
+        
+        # Console log, flushed in one write when the event loop is idle
+        self._log_buf = collections.deque(maxlen=256)
+        self._log_scheduled = False
         
         self.setup_ui()
+        
+        # Lay everything out once, then show the finished window
+        self.root.update_idletasks()
+        self.root.deiconify()
     
     def setup_ui(self):
         """Configuration de l'interface"""
+        # Everything lives in one frame so theme changes repaint only this subtree
+        self._theme_frame = tk.Frame(self.root, bg="#f0f2f5")
+        self._theme_frame.pack(fill="both", expand=True)
+        
         # Title
         title = tk.Label(
-            self.root,
+            self._theme_frame,
             text="🎮 Exemples Simples - Nouveaux Widgets",
-            font=("Arial", 18, "bold"),
+            font=self._f_title,
             bg="#f0f2f5",
             fg="#1a202c"
         )
         title.pack(pady=20)
         
         # Main container
-        main_frame = tk.Frame(self.root, bg="#f0f2f5")
+        main_frame = tk.Frame(self._theme_frame, bg="#f0f2f5")
         main_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         # Left column - Toggle & Progress
@@ -64,7 +138,7 @@ class SimpleWidgetExample:
         frame = tk.LabelFrame(
             parent, 
             text="🔘 Boutons Toggle",
-            font=("Arial", 12, "bold"),
+            font=self._f_hdr,
             bg="#ffffff",
             padx=15,
             pady=10
@@ -77,7 +151,7 @@ class SimpleWidgetExample:
             text="Cliquez sur les toggles pour changer leur état",
             bg="#ffffff",
             fg="#666666",
-            font=("Arial", 10)
+            font=self._f_sm
         )
         desc.pack(pady=(0, 15))
         
@@ -86,19 +160,17 @@ class SimpleWidgetExample:
         toggle1_frame.pack(fill="x", pady=5)
         
         tk.Label(toggle1_frame, text="Mode Sombre:", 
-                bg="#ffffff", font=("Arial", 11)).pack(side="left")
+                bg="#ffffff", font=self._f_lbl).pack(side="left")
         
         self.toggle1 = AnimatedToggle(
             initial_state=False,
-            style=ToggleStyle(
+            style=replace(
+                _TOGGLE_STYLE_BASE,
                 track_color_off="#e2e8f0",
-                track_color_on="#4299e1",
-                track_width=50,
-                track_height=25,
-                transition_duration=0.3
+                track_color_on="#4299e1"
             )
         )
-        self.toggle1.on_toggle(lambda state: self.on_dark_mode_change(state))
+        self.toggle1.on_toggle(self.on_dark_mode_change)
         self.toggle1.render(toggle1_frame, "tkinter").pack(side="right")
         
         # Toggle 2 - Notifications
@@ -106,19 +178,18 @@ class SimpleWidgetExample:
         toggle2_frame.pack(fill="x", pady=5)
         
         tk.Label(toggle2_frame, text="Notifications:", 
-                bg="#ffffff", font=("Arial", 11)).pack(side="left")
+                bg="#ffffff", font=self._f_lbl).pack(side="left")
         
         self.toggle2 = AnimatedToggle(
             initial_state=True,
-            style=ToggleStyle(
+            style=replace(
+                _TOGGLE_STYLE_BASE,
                 track_color_off="#fed7d7",
                 track_color_on="#48bb78",
-                track_width=50,
-                track_height=25,
                 bounce_effect=True
             )
         )
-        self.toggle2.on_toggle(lambda state: self.on_notifications_change(state))
+        self.toggle2.on_toggle(self.on_notifications_change)
         self.toggle2.render(toggle2_frame, "tkinter").pack(side="right")
         
         # Toggle 3 - Auto-save
@@ -126,20 +197,19 @@ class SimpleWidgetExample:
         toggle3_frame.pack(fill="x", pady=5)
         
         tk.Label(toggle3_frame, text="Sauvegarde Auto:", 
-                bg="#ffffff", font=("Arial", 11)).pack(side="left")
+                bg="#ffffff", font=self._f_lbl).pack(side="left")
         
         self.toggle3 = AnimatedToggle(
             initial_state=True,
-            style=ToggleStyle(
+            style=replace(
+                _TOGGLE_STYLE_BASE,
                 track_color_off="#e2e8f0",
                 track_color_on="#9f7aea",
                 glow_enabled=True,
-                glow_color="#9f7aea",
-                track_width=50,
-                track_height=25
+                glow_color="#9f7aea"
             )
         )
-        self.toggle3.on_toggle(lambda state: self.on_autosave_change(state))
+        self.toggle3.on_toggle(self.on_autosave_change)
         self.toggle3.render(toggle3_frame, "tkinter").pack(side="right")
         
         # Status display
@@ -148,7 +218,7 @@ class SimpleWidgetExample:
             text="État: Mode Sombre: OFF, Notifications: ON, Auto-save: ON",
             bg="#f7fafc",
             fg="#4a5568",
-            font=("Arial", 10),
+            font=self._f_sm,
             relief="solid",
             bd=1,
             padx=10,
@@ -161,7 +231,7 @@ class SimpleWidgetExample:
         frame = tk.LabelFrame(
             parent,
             text="📊 Barres de Progression",
-            font=("Arial", 12, "bold"),
+            font=self._f_hdr,
             bg="#ffffff",
             padx=15,
             pady=10
@@ -174,7 +244,7 @@ class SimpleWidgetExample:
             text="Différents types de barres de progression",
             bg="#ffffff",
             fg="#666666",
-            font=("Arial", 10)
+            font=self._f_sm
         )
         desc.pack(pady=(0, 15))
         
@@ -183,7 +253,7 @@ class SimpleWidgetExample:
         progress1_frame.pack(fill="x", pady=10)
         
         tk.Label(progress1_frame, text="Téléchargement:", 
-                bg="#ffffff", font=("Arial", 10)).pack(anchor="w")
+                bg="#ffffff", font=self._f_sm).pack(anchor="w")
         
         self.progress1 = AnimatedProgressBar(
             initial_value=35,
@@ -201,7 +271,7 @@ class SimpleWidgetExample:
         progress2_frame.pack(fill="x", pady=10)
         
         tk.Label(progress2_frame, text="Installation:", 
-                bg="#ffffff", font=("Arial", 10)).pack(anchor="w")
+                bg="#ffffff", font=self._f_sm).pack(anchor="w")
         
         self.progress2 = AnimatedProgressBar(
             initial_value=78,
@@ -219,7 +289,7 @@ class SimpleWidgetExample:
         progress3_frame.pack(fill="x", pady=10)
         
         tk.Label(progress3_frame, text="Analyse en cours:", 
-                bg="#ffffff", font=("Arial", 10)).pack(anchor="w")
+                bg="#ffffff", font=self._f_sm).pack(anchor="w")
         
         self.progress3 = AnimatedProgressBar(
             config=WidgetConfig(width=300, height=22),
@@ -280,7 +350,7 @@ class SimpleWidgetExample:
         frame = tk.LabelFrame(
             parent,
             text="📜 Vue Défilante",
-            font=("Arial", 12, "bold"),
+            font=self._f_hdr,
             bg="#ffffff",
             padx=15,
             pady=10
@@ -293,7 +363,7 @@ class SimpleWidgetExample:
             text="Contenu scrollable avec barres de défilement personnalisées",
             bg="#ffffff",
             fg="#666666",
-            font=("Arial", 10)
+            font=self._f_sm
         )
         desc.pack(pady=(0, 15))
         
@@ -323,6 +393,18 @@ class SimpleWidgetExample:
         scroll_widget = self.scroll_view.render(scroll_container, "tkinter")
         scroll_widget.pack(pady=10)
         
+        # All list rows are drawn on one canvas inside the scroll view
+        self._items_canvas = tk.Canvas(
+            self.scroll_view._content_frame,
+            width=_ROW_W,
+            height=0,
+            bg="#f7fafc",
+            highlightthickness=0
+        )
+        self._items_canvas.pack()
+        self._next_y = 0
+        self._item_count = 0
+        
         # Populate with content
         self.populate_scroll_content()
         
@@ -336,7 +418,7 @@ class SimpleWidgetExample:
             config=WidgetConfig(width=80, height=25),
             style=ButtonStyle(normal_color="#4299e1", hover_color="#3182ce")
         )
-        top_btn.on_click(lambda: self.scroll_view.scroll_to(0, 0))
+        top_btn.on_click(partial(self.scroll_view.scroll_to, 0, 0))
         top_btn.render(scroll_controls, "tkinter").pack(side="left", padx=2)
         
         middle_btn = AnimatedButton(
@@ -380,66 +462,102 @@ class SimpleWidgetExample:
         ]
         
         for i, (icon, title, desc) in enumerate(content_types):
-            self.create_scroll_item(icon, f"{title} {i+1}", desc)
+            self._draw_scroll_item(icon, f"{title} {i+1}", desc)
+        
+        # Resize once for the whole batch
+        self._items_canvas.configure(height=self._next_y)
     
     def create_scroll_item(self, icon, title, description):
         """Créer un élément pour la vue scrollable"""
-        item_frame = tk.Frame(
-            self.scroll_view._content_frame,
-            bg="#ffffff",
-            relief="solid",
-            bd=1
+        self._draw_scroll_item(icon, title, description)
+        self._items_canvas.configure(height=self._next_y)
+    
+    def _draw_scroll_item(self, icon, title, description):
+        """Dessiner une ligne sur le canvas de la liste"""
+        canvas = self._items_canvas
+        y = self._next_y
+        
+        canvas.create_rectangle(
+            5, y + 3, _ROW_W - 5, y + _ROW_H - 3,
+            fill="#ffffff", outline="#e2e8f0"
         )
-        item_frame.pack(fill="x", pady=3, padx=5)
-        
-        # Content
-        content_frame = tk.Frame(item_frame, bg="#ffffff")
-        content_frame.pack(fill="x", padx=10, pady=8)
         
         # Header with icon and title
-        header_frame = tk.Frame(content_frame, bg="#ffffff")
-        header_frame.pack(fill="x")
-        
-        tk.Label(
-            header_frame,
+        canvas.create_text(
+            15, y + 17,
             text=f"{icon} {title}",
-            bg="#ffffff",
-            font=("Arial", 11, "bold"),
-            fg="#2d3748"
-        ).pack(side="left")
+            font=self._f_bold_sm,
+            fill="#2d3748",
+            anchor="w"
+        )
         
         # Description
-        tk.Label(
-            content_frame,
+        canvas.create_text(
+            15, y + 36,
             text=description,
-            bg="#ffffff",
-            font=("Arial", 9),
-            fg="#718096"
-        ).pack(anchor="w", pady=(3, 0))
+            font=self._f_xs,
+            fill="#718096",
+            anchor="w"
+        )
+        
+        self._next_y += _ROW_H
+    
+    # Console log
+    def _log(self, msg):
+        """Mettre un message en file pour la console"""
+        self._log_buf.append(msg)
+        if not self._log_scheduled:
+            self._log_scheduled = True
+            self.root.after_idle(self._flush_log)
+    
+    def _flush_log(self):
+        """Écrire les messages en attente en une seule fois"""
+        try:
+            stdout = sys.stdout
+            if stdout is None:
+                # No console (pythonw): drop the messages, as print() would
+                return
+            
+            data = "\n".join(self._log_buf) + "\n"
+            # Raw byte stream looked up on each flush, since stdout can be
+            # swapped (redirect_stdout); IDLE and co. have no .buffer
+            buffer = getattr(stdout, "buffer", None)
+            if buffer is not None:
+                buffer.write(data.encode("utf-8"))
+            else:
+                stdout.write(data)
+            stdout.flush()
+        finally:
+            self._log_buf.clear()
+            self._log_scheduled = False
     
     # Event handlers
     def on_dark_mode_change(self, state):
         """Gérer le changement de mode sombre"""
         mode = "ON" if state else "OFF"
-        print(f"🌙 Mode Sombre: {mode}")
+        self._log(f"🌙 Mode Sombre: {mode}")
         self.update_toggle_status()
         
         # Visual feedback
+        if state == self._last_dark:
+            return
+        self._last_dark = state
+        
         if state:
-            self.root.configure(bg="#2d3748")
+            self._theme_frame.configure(bg="#2d3748")
         else:
-            self.root.configure(bg="#f0f2f5")
+            self._theme_frame.configure(bg="#f0f2f5")
     
     def on_notifications_change(self, state):
         """Gérer le changement de notifications"""
         mode = "ON" if state else "OFF"
-        print(f"🔔 Notifications: {mode}")
+        self._log(f"🔔 Notifications: {mode}")
         self.update_toggle_status()
     
     def on_autosave_change(self, state):
         """Gérer le changement de sauvegarde automatique"""
         mode = "ON" if state else "OFF"
-        print(f"💾 Sauvegarde Auto: {mode}")
+        self._log(f"💾 Sauvegarde Auto: {mode}")
         self.update_toggle_status()
         
         if state:
@@ -447,11 +565,12 @@ class SimpleWidgetExample:
     
     def update_toggle_status(self):
         """Mettre à jour l'affichage du statut des toggles"""
-        dark_mode = "ON" if self.toggle1.get_value() else "OFF"
-        notifications = "ON" if self.toggle2.get_value() else "OFF"
-        autosave = "ON" if self.toggle3.get_value() else "OFF"
+        st = (self.toggle1.get_value(), self.toggle2.get_value(), self.toggle3.get_value())
+        if st == self._last_status:
+            return
+        self._last_status = st
         
-        status_text = f"État: Mode Sombre: {dark_mode}, Notifications: {notifications}, Auto-save: {autosave}"
+        status_text = _STATUS_FMT.format(*("ON" if value else "OFF" for value in st))
         self.toggle_status.configure(text=status_text)
     
     def toggle_auto_progress(self):
@@ -467,51 +586,64 @@ class SimpleWidgetExample:
         self.auto_progress_btn.set_text("⏸️ Arrêter Auto")
         self.auto_progress_btn.set_colors(normal="#f56565")
         
-        def progress_loop():
-            current_val = 0
-            direction = 1
-            
-            while self.auto_progress:
-                current_val += direction * 2
-                
-                if current_val >= 100:
-                    current_val = 100
-                    direction = -1
-                elif current_val <= 0:
-                    current_val = 0
-                    direction = 1
-                
-                # Update progress bars
-                self.progress1.set_value(current_val)
-                self.progress2.set_value(min(100, current_val * 1.2))
-                
-                time.sleep(0.1)
-        
-        self.progress_thread = threading.Thread(target=progress_loop, daemon=True)
-        self.progress_thread.start()
+        self._prog_vals = np.zeros(2) if np is not None else [0.0, 0.0]
+        self.direction = 1
+        self._tick()
+    
+    def _tick(self):
+        """Avancer la progression automatique d'un pas (boucle Tk)"""
+        self.direction = _advance(self._prog_vals, self.direction, 2.0)
+        
+        # Update progress bars
+        self._set_progresses(float(self._prog_vals[0]), float(self._prog_vals[1]))
+        
+        if self.auto_progress:
+            self._after_id = self.root.after(100, self._tick)
     
     def stop_auto_progress(self):
         """Arrêter la progression automatique"""
         self.auto_progress = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
         self.auto_progress_btn.set_text("▶️ Démarrer Auto")
         self.auto_progress_btn.set_colors(normal="#48bb78")
     
+    def _set_progresses(self, v1, v2):
+        """Mettre à jour les deux barres couplées dans le même tour de boucle"""
+        # Both canvases are invalidated before Tk's next idle pass, which
+        # repaints them together; forcing update_idletasks here would split it
+        self.progress1.set_value(v1)
+        self.progress2.set_value(v2)
+    
+    def _request_progresses(self, v1, v2):
+        """Appliquer (v1, v2) au prochain passage idle, la dernière demande gagne"""
+        self._pending_prog = (v1, v2)
+        if not self._pending_scheduled:
+            self._pending_scheduled = True
+            self.root.after_idle(self._apply_prog)
+    
+    def _apply_prog(self):
+        """Appliquer les dernières valeurs demandées"""
+        pending, self._pending_prog = self._pending_prog, None
+        self._pending_scheduled = False
+        if pending is not None:
+            self._set_progresses(*pending)
+    
     def reset_progress(self):
         """Remettre à zéro les barres de progression"""
         self.stop_auto_progress()
-        self.progress1.set_value(0)
-        self.progress2.set_value(0)
-        print("🔄 Progression remise à zéro")
+        self._request_progresses(0, 0)
+        self._log("🔄 Progression remise à zéro")
     
     def randomize_progress(self):
         """Valeurs aléatoires pour les barres de progression"""
         val1 = random.randint(10, 95)
         val2 = random.randint(15, 90)
         
-        self.progress1.set_value(val1)
-        self.progress2.set_value(val2)
+        self._request_progresses(val1, val2)
         
-        print(f"🎲 Valeurs aléatoires: {val1}%, {val2}%")
+        self._log(f"🎲 Valeurs aléatoires: {val1}%, {val2}%")
     
     def scroll_to_middle(self):
         """Défiler vers le milieu du contenu"""
@@ -527,13 +659,10 @@ class SimpleWidgetExample:
     
     def add_scroll_item(self):
         """Ajouter un nouvel élément au contenu scrollable"""
-        import random
+        icon = random.choice(_ADD_ICONS)
         
-        icons = ["⭐", "🎉", "🚀", "💎", "🌟", "🎁", "🏆", "🎯"]
-        icon = random.choice(icons)
-        
-        item_count = len(self.scroll_view._child_widgets) + 1
-        title = f"Nouvel élément {item_count}"
+        self._item_count += 1
+        title = f"Nouvel élément {self._item_count}"
         desc = "Ajouté dynamiquement par l'utilisateur"
         
         self.create_scroll_item(icon, title, desc)
@@ -541,7 +670,7 @@ class SimpleWidgetExample:
         # Auto-scroll to new item
         self.scroll_to_bottom()
         
-        print(f"➕ Nouvel élément ajouté: {title}")
+        self._log(f"➕ Nouvel élément ajouté: {title}")
     
     def run(self):
         """Lancer l'application"""
@@ -554,15 +683,15 @@ class SimpleWidgetExample:
         
         self.root.mainloop()
 
+def _report_error(exc_type, exc, tb):
+    """Afficher une erreur non interceptée"""
+    sys.stderr.write(f"❌ Erreur: {exc}\n")
+    traceback.print_exception(exc_type, exc, tb)
+
 def main():
     """Point d'entrée principal"""
-    try:
-        app = SimpleWidgetExample()
-        app.run()
-    except Exception as e:
-        print(f"❌ Erreur: {e}")
-        import traceback
-        traceback.print_exc()
+    sys.excepthook = _report_error
+    SimpleWidgetExample().run()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
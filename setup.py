@@ -2,16 +2,16 @@
 Setup configuration for AnimatedWidgetsPack
 """
 
-from setuptools import setup, find_packages
-import os
+from setuptools import setup
 
 # Read README
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
-# Read requirements
-with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+# Core requirements (keep in sync with requirements.txt)
+requirements = (
+    "typing-extensions>=4.0.0",
+)
 
 setup(
     name="animated-widgets-pack",
@@ -27,7 +27,7 @@ setup(
         "Documentation": "https://animated-widgets-pack.readthedocs.io/",
         "Source Code": "https://github.com/yourusername/animated-widgets-pack",
     },
-    packages=find_packages(),
+    packages=["animated_widgets_pack"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -43,7 +43,7 @@ setup(
         "Operating System :: OS Independent",
     ],
     python_requires=">=3.8",
-    install_requires=requirements,
+    install_requires=list(requirements),
     extras_require={
         "dev": [
             "pytest>=6.0",
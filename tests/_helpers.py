@@ -0,0 +1,52 @@
+"""
+Shared helpers for the test suite
+"""
+
+import unittest
+import sys
+import os
+
+# Tests that run real animation threads: `pytest -m "not slow"` deselects
+# them and SKIP_TIMING_TESTS=1 skips them under the plain unittest runner
+SKIP_TIMING_TESTS = os.environ.get("SKIP_TIMING_TESTS") == "1"
+
+def timing_test(test):
+    """Mark a test that runs real animation threads"""
+    if "pytest" in sys.modules:
+        import pytest
+        test = pytest.mark.slow(test)
+    return unittest.skipIf(SKIP_TIMING_TESTS, "SKIP_TIMING_TESTS=1")(test)
+
+class FakeClock:
+    """Virtual clock standing in for the time module in animation tests"""
+    
+    def __init__(self):
+        self._now = 0.0
+    
+    def time(self):
+        return self._now
+    
+    def advance(self, seconds):
+        self._now += seconds
+    
+    sleep = advance
+
+class Counter:
+    """Minimal call-counting callback, cheaper than Mock for call counts"""
+    __slots__ = ("n", "last_args", "last_kwargs")
+    
+    def __init__(self):
+        self.n = 0
+        self.last_args = None
+        self.last_kwargs = None
+    
+    def __call__(self, *args, **kwargs):
+        self.n += 1
+        self.last_args = args
+        self.last_kwargs = kwargs
+    
+    def assert_called_once(self):
+        assert self.n == 1, f"Expected 1 call, got {self.n}"
+    
+    def assert_not_called(self):
+        assert self.n == 0, f"Expected no calls, got {self.n}"
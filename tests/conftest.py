@@ -0,0 +1,9 @@
+"""
+pytest configuration for the test suite
+"""
+
+import sys
+import os
+
+# Add library path once for the whole session
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
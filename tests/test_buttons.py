@@ -3,17 +3,20 @@ Unit tests for animated buttons
 """
 
 import unittest
-import time
 import threading
+from dataclasses import replace
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
 
-# Add library path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add library path when run as a script or under plain unittest
+# (pytest gets it from tests/conftest.py)
+if "pytest" not in sys.modules:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from animated_widgets_pack import AnimatedButton, WidgetConfig, ButtonStyle
 from animated_widgets_pack.utils import ColorUtils
+from tests._helpers import Counter, FakeClock, timing_test
 
 class TestButtonStyle(unittest.TestCase):
     """Tests for ButtonStyle dataclass"""
@@ -57,35 +60,80 @@ class TestButtonStyle(unittest.TestCase):
 class TestAnimatedButton(unittest.TestCase):
     """Tests for AnimatedButton class"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.config = WidgetConfig(
-            width=120, height=40,
-            animation_duration=0.1  # Short for testing
-        )
-        
-        self.style = ButtonStyle(
+    @classmethod
+    def setUpClass(cls):
+        """Build the button once; setUp resets it before every test"""
+        cls._template_style = ButtonStyle(
+            text="Test Button",
             normal_color="#3498db",
             hover_color="#2980b9",
             pressed_color="#21618c"
         )
         
-        self.button = AnimatedButton(
+        cls._template_button = AnimatedButton(
             text="Test Button",
-            config=self.config,
-            style=self.style
+            config=WidgetConfig(
+                width=120, height=40,
+                animation_duration=0.1  # Short for testing
+            ),
+            style=replace(cls._template_style)
         )
+        cls._template_manager = cls._template_button._animation_manager
+        cls._template_color = cls._template_button._current_color
+    
+    @classmethod
+    def _reset(cls, button):
+        """Put the shared button back into its freshly constructed state"""
+        for callbacks in button._callbacks.values():
+            callbacks.clear()
+        button._widget_state = "normal"
+        button._is_pressed = False
+        button._current_scale = 1.0
+        button._current_lift = 0.0
+        button._current_color = cls._template_color
+        button.style = replace(cls._template_style)
+        button._animation_manager = cls._template_manager
+        button._gui_widget = None
+        button._gui_framework = None
+    
+    def _fresh_button(self):
+        """Build a new button with the real AnimationManager for this test only"""
+        button = AnimatedButton(
+            text="Test Button",
+            config=WidgetConfig(
+                width=120, height=40,
+                animation_duration=0.1  # Short for testing
+            ),
+            style=replace(self._template_style)
+        )
+        self.addCleanup(button.stop_all_animations)
+        return button
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.button = self._template_button
+        self._reset(self.button)
+        self.config = self.button.config
+        self.style = self.button.style
     
     def test_button_initialization(self):
         """Test button initialization"""
-        self.assertEqual(self.button.style.text, "Test Button")
-        self.assertEqual(self.button.get_state(), "normal")
-        self.assertIsNotNone(self.button._animation_manager)
-        self.assertEqual(self.button._current_scale, 1.0)
-        self.assertEqual(self.button._current_lift, 0.0)
-        self.assertFalse(self.button._is_pressed)
-        self.assertIsNone(self.button._gui_widget)
-        self.assertIsNone(self.button._gui_framework)
+        # Fresh instance: the shared button's state comes from _reset()
+        button = AnimatedButton(
+            text="Test Button",
+            config=WidgetConfig(width=120, height=40),
+            style=ButtonStyle(normal_color="#3498db")
+        )
+        
+        self.assertEqual(button.style.text, "Test Button")
+        self.assertEqual(button.get_state(), "normal")
+        self.assertIsNotNone(button._animation_manager)
+        self.assertEqual(button._current_scale, 1.0)
+        self.assertEqual(button._current_lift, 0.0)
+        self.assertEqual(button._current_color.to_hex(), "#3498db")
+        self.assertFalse(button._is_pressed)
+        self.assertIsNone(button._gui_widget)
+        self.assertIsNone(button._gui_framework)
     
     def test_color_parsing(self):
         """Test color parsing on initialization"""
@@ -114,10 +162,10 @@ class TestAnimatedButton(unittest.TestCase):
     
     def test_callbacks(self):
         """Test event callbacks"""
-        # Mock callbacks
-        click_callback = Mock()
-        hover_enter_callback = Mock()
-        hover_leave_callback = Mock()
+        # Counting callbacks
+        click_callback = Counter()
+        hover_enter_callback = Counter()
+        hover_leave_callback = Counter()
         
         # Bind callbacks
         self.button.on_click(click_callback)
@@ -136,8 +184,8 @@ class TestAnimatedButton(unittest.TestCase):
     
     def test_multiple_callbacks(self):
         """Test multiple callbacks for same event"""
-        callback1 = Mock()
-        callback2 = Mock()
+        callback1 = Counter()
+        callback2 = Counter()
         
         self.button.on_click(callback1)
         self.button.on_click(callback2)
@@ -195,6 +243,9 @@ class TestAnimatedButton(unittest.TestCase):
     @patch('animated_widgets_pack.buttons.AnimatedButton.update_appearance')
     def test_hover_simulation(self, mock_update):
         """Test simulated hover events"""
+        # Own button: the real hover animations must not touch the shared one
+        self.button = self._fresh_button()
+        
         # Simulate mouse enter
         self.button._on_hover_enter()
         self.assertEqual(self.button.get_state(), "hover")
@@ -209,7 +260,9 @@ class TestAnimatedButton(unittest.TestCase):
     @patch('animated_widgets_pack.buttons.AnimatedButton.update_appearance')
     def test_click_simulation(self, mock_update):
         """Test simulated click events"""
-        click_callback = Mock()
+        self.button = self._fresh_button()
+        
+        click_callback = Counter()
         self.button.on_click(click_callback)
         
         # Simulate press
@@ -238,7 +291,7 @@ class TestAnimatedButton(unittest.TestCase):
         self.assertFalse(self.button._is_pressed)
         
         # Click callback should not be triggered when disabled
-        click_callback = Mock()
+        click_callback = Counter()
         self.button.on_click(click_callback)
         self.button._on_click()
         click_callback.assert_not_called()
@@ -256,63 +309,32 @@ class TestAnimatedButton(unittest.TestCase):
         mock_animation_manager_class.assert_called_once()
         self.assertEqual(button._animation_manager, mock_manager)
     
-    def test_color_transition_animation(self):
-        """Test color transition animation"""
-        start_color = ColorUtils.parse_color("#ff0000")  # Red
-        end_color = ColorUtils.parse_color("#0000ff")    # Blue
-        
-        # Mock animation manager to capture calls
-        mock_manager = Mock()
-        self.button._animation_manager = mock_manager
-        
-        self.button._animate_color_transition(start_color, end_color, duration=0.1)
-        
-        # Verify animation was started
-        mock_manager.animate.assert_called_once()
-        args, kwargs = mock_manager.animate.call_args
-        
-        self.assertEqual(args[0], "color")  # animation ID
-        self.assertEqual(args[1], 0.0)      # start value
-        self.assertEqual(args[2], 1.0)      # end value
+    # (method, positional args, keyword args, animation ID, start, end)
+    ANIMATION_CASES = (
+        ("_animate_color_transition",
+         (ColorUtils.parse_color("#ff0000"), ColorUtils.parse_color("#0000ff")),
+         dict(duration=0.1), "color", 0.0, 1.0),
+        ("pulse_animation", (), dict(duration=1.0, scale_factor=1.5), "pulse", 0.0, 1.0),
+        ("flash_animation", (), dict(flash_color="#ffffff", duration=0.3), "flash", 0.0, 1.0),
+        ("bounce_animation", (), dict(duration=0.6), "bounce", 1.0, 0.0),
+    )
     
-    def test_pulse_animation(self):
-        """Test pulse animation"""
-        mock_manager = Mock()
-        self.button._animation_manager = mock_manager
-        
-        self.button.pulse_animation(duration=1.0, scale_factor=1.5)
-        
-        # Verify pulse animation was started
-        mock_manager.animate.assert_called_once()
-        args, kwargs = mock_manager.animate.call_args
-        
-        self.assertEqual(args[0], "pulse")  # animation ID
-    
-    def test_flash_animation(self):
-        """Test flash animation"""
-        mock_manager = Mock()
-        self.button._animation_manager = mock_manager
-        
-        self.button.flash_animation(flash_color="#ffffff", duration=0.3)
-        
-        # Verify flash animation was started
-        mock_manager.animate.assert_called_once()
-        args, kwargs = mock_manager.animate.call_args
-        
-        self.assertEqual(args[0], "flash")  # animation ID
-    
-    def test_bounce_animation(self):
-        """Test bounce animation"""
-        mock_manager = Mock()
-        self.button._animation_manager = mock_manager
-        
-        self.button.bounce_animation(duration=0.6)
-        
-        # Verify bounce animation was started
-        mock_manager.animate.assert_called_once()
-        args, kwargs = mock_manager.animate.call_args
-        
-        self.assertEqual(args[0], "bounce")  # animation ID
+    def test_animation_ids(self):
+        """Test each animation starts under its own ID"""
+        for name, args, kwargs, animation_id, start, end in self.ANIMATION_CASES:
+            with self.subTest(name):
+                mock_manager = Mock()
+                self.button._animation_manager = mock_manager
+                
+                getattr(self.button, name)(*args, **kwargs)
+                
+                # Verify animation was started
+                mock_manager.animate.assert_called_once()
+                call_args, _ = mock_manager.animate.call_args
+                
+                self.assertEqual(call_args[0], animation_id)
+                self.assertEqual(call_args[1], start)
+                self.assertEqual(call_args[2], end)
     
     def test_stop_all_animations(self):
         """Test stopping all animations"""
@@ -350,7 +372,7 @@ class TestAnimatedButton(unittest.TestCase):
     
     def test_method_chaining(self):
         """Test method chaining with on_click"""
-        callback = Mock()
+        callback = Counter()
         
         # on_click should return self for chaining
         result = self.button.on_click(callback)
@@ -387,9 +409,14 @@ class TestButtonIntegration(unittest.TestCase):
         """Set up integration test"""
         self.config = WidgetConfig(animation_duration=0.05)  # Very short for testing
         self.button = AnimatedButton("Integration Test", self.config)
+        
+        # State changes run synchronously; only the timing tests
+        # put the real animation manager back
+        self.animation_manager = self.button._animation_manager
+        self.button._animation_manager = Mock()
     
-    def test_full_interaction_cycle(self):
-        """Test complete interaction cycle"""
+    def _run_interaction_cycle(self):
+        """Simulate hover, press, click, release and leave"""
         # Track state changes
         state_changes = []
         self.button.bind_callback('state_changed', 
@@ -406,6 +433,12 @@ class TestButtonIntegration(unittest.TestCase):
         self.button._on_release()
         self.button._on_hover_leave()
         
+        return state_changes, clicks
+    
+    def test_full_interaction_cycle(self):
+        """Test complete interaction cycle"""
+        state_changes, clicks = self._run_interaction_cycle()
+        
         # Verify state changes occurred
         self.assertGreater(len(state_changes), 0)
         self.assertEqual(len(clicks), 1)
@@ -413,19 +446,38 @@ class TestButtonIntegration(unittest.TestCase):
         # Should end in normal state
         self.assertEqual(self.button.get_state(), "normal")
     
+    @timing_test
+    def test_full_interaction_cycle_with_real_animator(self):
+        """Test complete interaction cycle driving the real animation manager"""
+        self.button._animation_manager = self.animation_manager
+        
+        with patch('animated_widgets_pack.animations.time', FakeClock()):
+            state_changes, clicks = self._run_interaction_cycle()
+            for thread in list(self.animation_manager._active_animations.values()):
+                thread.join()
+        
+        self.assertGreater(len(state_changes), 0)
+        self.assertEqual(len(clicks), 1)
+        self.assertEqual(self.button.get_state(), "normal")
+        self.assertEqual(self.animation_manager.get_active_count(), 0)
+    
+    @timing_test
     def test_animation_with_real_timing(self):
         """Test animation with real timing (short duration)"""
+        self.button._animation_manager = self.animation_manager
         original_color = self.button._current_color
         
-        # Start animation
-        self.button._on_hover_enter()
-        
-        # Let animation run briefly
-        time.sleep(0.1)
-        
-        # Color should have changed from original
-        # (Note: exact comparison difficult due to threading)
-        self.assertIsNotNone(self.button._current_color)
+        # Frame sleeps advance a virtual clock, so the animation
+        # threads play every frame without waiting in real time
+        with patch('animated_widgets_pack.animations.time', FakeClock()):
+            self.button._on_hover_enter()
+            for thread in list(self.button._animation_manager._active_animations.values()):
+                thread.join()
+        
+        # Color should have changed from original to the hover color
+        self.assertNotEqual(self.button._current_color, original_color)
+        self.assertEqual(self.button._current_color.to_hex(),
+                         self.button.style.hover_color)
     
     def tearDown(self):
         """Clean up integration test"""
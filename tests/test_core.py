@@ -3,16 +3,43 @@ Unit tests for the core module
 """
 
 import unittest
-import time
 import threading
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 import sys
 import os
 
-# Add library path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add library path when run as a script or under plain unittest
+# (pytest gets it from tests/conftest.py)
+if "pytest" not in sys.modules:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from animated_widgets_pack import core
 from animated_widgets_pack.core import AnimatedWidget, WidgetConfig
+from tests._helpers import Counter, FakeClock
+
+class ManualThread:
+    """
+    Synchronous stand-in for threading.Thread in animate_property
+    Nothing runs on start(); each tick() plays one animation frame
+    """
+    
+    def __init__(self, target=None, args=(), **kwargs):
+        self._widget = target.__self__
+        self.args = args
+        self.do_run = True
+        self.finished = False
+        self.start_time = None
+    
+    def start(self):
+        self.start_time = core.time.time()
+    
+    def tick(self, now: float):
+        """Run one frame of the animation loop at virtual time `now`"""
+        if self.do_run and not self.finished:
+            self.finished = self._widget._animate_property_frame(
+                *self.args, now - self.start_time
+            )
 
 class TestWidget(AnimatedWidget):
     """Test implementation of AnimatedWidget for testing"""
@@ -73,6 +100,22 @@ class TestAnimatedWidget(unittest.TestCase):
         """Set up test fixtures"""
         self.config = WidgetConfig(animation_duration=0.1)  # Short for testing
         self.widget = TestWidget(self.config)
+        
+        # Drive animations from a virtual clock instead of real sleeps
+        self.clock = FakeClock()
+        fake_threading = SimpleNamespace(Thread=ManualThread,
+                                         current_thread=threading.current_thread)
+        for target, fake in (('animated_widgets_pack.core.time', self.clock),
+                             ('animated_widgets_pack.core.threading', fake_threading)):
+            patcher = patch(target, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def tick(self, seconds: float):
+        """Advance the virtual clock and run one frame of each animation"""
+        self.clock.advance(seconds)
+        for thread in list(self.widget._current_animations.values()):
+            thread.tick(self.clock.time())
     
     def test_initialization(self):
         """Test widget initialization"""
@@ -90,7 +133,7 @@ class TestAnimatedWidget(unittest.TestCase):
     
     def test_callback_binding(self):
         """Test callback binding and triggering"""
-        callback = Mock()
+        callback = Counter()
         self.widget.bind_callback('click', callback)
         
         self.widget.trigger_callback('click')
@@ -98,8 +141,8 @@ class TestAnimatedWidget(unittest.TestCase):
     
     def test_multiple_callbacks(self):
         """Test multiple callbacks for same event"""
-        callback1 = Mock()
-        callback2 = Mock()
+        callback1 = Counter()
+        callback2 = Counter()
         
         self.widget.bind_callback('click', callback1)
         self.widget.bind_callback('click', callback2)
@@ -119,7 +162,7 @@ class TestAnimatedWidget(unittest.TestCase):
     
     def test_invalid_event_type(self):
         """Test binding to invalid event type"""
-        callback = Mock()
+        callback = Counter()
         self.widget.bind_callback('invalid_event', callback)
         
         # Should not raise error, just not call callback
@@ -156,7 +199,7 @@ class TestAnimatedWidget(unittest.TestCase):
     
     def test_no_state_change_callback(self):
         """Test no callback when state doesn't change"""
-        callback = Mock()
+        callback = Counter()
         self.widget.bind_callback('state_changed', callback)
         
         self.widget.set_state("normal")  # Already normal
@@ -180,14 +223,14 @@ class TestAnimatedWidget(unittest.TestCase):
         self.widget.animate_property("test_property", 0, 100, duration=0.1)
         
         # Should start animation
-        time.sleep(0.05)  # Wait a bit
+        self.tick(0.05)
         
         # Property should be between start and end
         self.assertGreater(self.widget.test_property, 0)
         self.assertLess(self.widget.test_property, 100)
         
-        # Wait for animation to complete
-        time.sleep(0.15)
+        # Run past the end of the animation
+        self.tick(0.1)
         
         # Should reach end value
         self.assertAlmostEqual(self.widget.test_property, 100, delta=1)
@@ -197,13 +240,13 @@ class TestAnimatedWidget(unittest.TestCase):
         self.widget.test_property = 0
         
         self.widget.animate_property("test_property", 0, 100, duration=0.2)
-        time.sleep(0.05)  # Let animation start
+        self.tick(0.05)  # Let animation start
         
         # Stop animation
         self.widget.stop_all_animations()
         
         current_value = self.widget.test_property
-        time.sleep(0.1)  # Wait more
+        self.tick(0.1)  # Wait more
         
         # Value should not have changed much after stopping
         self.assertAlmostEqual(self.widget.test_property, current_value, delta=5)
@@ -229,7 +272,7 @@ class TestAnimatedWidget(unittest.TestCase):
         self.assertTrue(self.widget.is_animating())
         
         # Wait for completion
-        time.sleep(0.15)
+        self.tick(0.15)
         self.assertFalse(self.widget.is_animating())
     
     def test_concurrent_animations(self):
@@ -240,7 +283,7 @@ class TestAnimatedWidget(unittest.TestCase):
         self.widget.animate_property("prop1", 0, 100, duration=0.1)
         self.widget.animate_property("prop2", 0, 200, duration=0.1)
         
-        time.sleep(0.15)  # Wait for completion
+        self.tick(0.15)  # Wait for completion
         
         self.assertAlmostEqual(self.widget.prop1, 100, delta=1)
         self.assertAlmostEqual(self.widget.prop2, 200, delta=1)
@@ -251,13 +294,13 @@ class TestAnimatedWidget(unittest.TestCase):
         
         # Start first animation
         self.widget.animate_property("test_property", 0, 100, duration=0.2)
-        time.sleep(0.05)
+        self.tick(0.05)
         
         intermediate_value = self.widget.test_property
         
         # Start second animation (should override first)
         self.widget.animate_property("test_property", intermediate_value, 200, duration=0.1)
-        time.sleep(0.15)
+        self.tick(0.15)
         
         # Should reach second animation's target
         self.assertAlmostEqual(self.widget.test_property, 200, delta=5)
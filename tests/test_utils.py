@@ -4,27 +4,55 @@ Unit tests for the utils module
 
 import unittest
 import math
+from math import isclose
 import sys
 import os
+from dataclasses import FrozenInstanceError
 
-# Add library path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Add library path when run as a script or under plain unittest
+# (pytest gets it from tests/conftest.py)
+if "pytest" not in sys.modules:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from animated_widgets_pack.utils import (
     Color, ColorUtils, Point, Rectangle, GeometryUtils, ColorPalettes
 )
 
-class TestColor(unittest.TestCase):
+# Warm up parse_color once so no test pays first-call setup costs
+ColorUtils.parse_color("rgba(0, 0, 0, 1)")
+
+# Immutable fixtures shared by several test classes
+P_ORIGIN = Point(0, 0)
+P_3_4 = Point(3, 4)
+P_IN = Point(50, 40)
+P_TL = Point(10, 20)
+P_BR = Point(110, 70)
+P_OUT1 = Point(5, 15)
+P_OUT2 = Point(120, 80)
+RED = Color(255, 0, 0)
+BLUE = Color(0, 0, 255)
+ORANGE = Color(255, 128, 64)
+
+class _ColorAssertMixin:
+    """Single-call channel check for Color results"""
+    
+    def assertRGBA(self, color, r, g, b, a=1.0):
+        self.assertEqual((color.r, color.g, color.b, color.a), (r, g, b, a))
+
+class TestColor(_ColorAssertMixin, unittest.TestCase):
     """Tests for Color dataclass"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Colors shared (read-only) by the tests below"""
+        cls.C = ORANGE
+        cls.C_A = Color(255, 128, 64, 0.8)
+    
     def test_color_initialization(self):
         """Test color initialization"""
         # Default alpha
-        color = Color(255, 128, 64)
-        self.assertEqual(color.r, 255)
-        self.assertEqual(color.g, 128)
-        self.assertEqual(color.b, 64)
-        self.assertEqual(color.a, 1.0)
+        color = self.C
+        self.assertRGBA(color, 255, 128, 64)
         
         # Custom alpha
         color_alpha = Color(255, 128, 64, 0.5)
@@ -32,131 +60,104 @@ class TestColor(unittest.TestCase):
     
     def test_color_to_hex(self):
         """Test color to hex conversion"""
-        color = Color(255, 128, 64)
-        self.assertEqual(color.to_hex(), "#ff8040")
-        
-        # Test with zero values
-        black = Color(0, 0, 0)
-        self.assertEqual(black.to_hex(), "#000000")
-        
-        # Test with max values
-        white = Color(255, 255, 255)
-        self.assertEqual(white.to_hex(), "#ffffff")
+        # Regular, zero and max values
+        hexes = tuple(c.to_hex() for c in (self.C, Color(0, 0, 0), Color(255, 255, 255)))
+        self.assertEqual(hexes, ("#ff8040", "#000000", "#ffffff"))
     
     def test_color_to_rgba_string(self):
         """Test color to RGBA string conversion"""
-        color = Color(255, 128, 64, 0.8)
+        color = self.C_A
         self.assertEqual(color.to_rgba_string(), "rgba(255, 128, 64, 0.8)")
         
         # Test with default alpha
-        color_default = Color(255, 128, 64)
+        color_default = self.C
         self.assertEqual(color_default.to_rgba_string(), "rgba(255, 128, 64, 1.0)")
     
+    def test_color_is_immutable(self):
+        """Test frozen Color/Point/Rectangle reject attribute writes"""
+        for obj, field in ((self.C, "r"), (P_ORIGIN, "x"), (Rectangle(0, 0, 1, 1), "width")):
+            with self.subTest(type=type(obj).__name__):
+                with self.assertRaises(FrozenInstanceError):
+                    setattr(obj, field, 0)
+        
+        # Equal values hash alike, so colors can key caches
+        self.assertEqual(hash(Color(255, 128, 64)), hash(self.C))
+    
     def test_color_tuples(self):
         """Test color tuple conversions"""
-        color = Color(255, 128, 64, 0.8)
+        color = self.C_A
         
         self.assertEqual(color.to_rgb_tuple(), (255, 128, 64))
         self.assertEqual(color.to_rgba_tuple(), (255, 128, 64, 0.8))
 
-class TestColorUtils(unittest.TestCase):
+class TestColorUtils(_ColorAssertMixin, unittest.TestCase):
     """Tests for ColorUtils class"""
     
     def test_hex_to_rgb(self):
         """Test hex to RGB conversion"""
-        # Standard hex
-        self.assertEqual(ColorUtils.hex_to_rgb("#ff8040"), (255, 128, 64))
-        self.assertEqual(ColorUtils.hex_to_rgb("ff8040"), (255, 128, 64))
-        
-        # Short hex
-        self.assertEqual(ColorUtils.hex_to_rgb("#f80"), (255, 136, 0))
-        self.assertEqual(ColorUtils.hex_to_rgb("f80"), (255, 136, 0))
-        
-        # Black and white
-        self.assertEqual(ColorUtils.hex_to_rgb("#000000"), (0, 0, 0))
-        self.assertEqual(ColorUtils.hex_to_rgb("#ffffff"), (255, 255, 255))
+        cases = (
+            # Standard hex
+            ("#ff8040", (255, 128, 64)),
+            ("ff8040", (255, 128, 64)),
+            # Short hex
+            ("#f80", (255, 136, 0)),
+            ("f80", (255, 136, 0)),
+            # Black and white
+            ("#000000", (0, 0, 0)),
+            ("#ffffff", (255, 255, 255)),
+        )
+        for hex_color, expected in cases:
+            with self.subTest(hex_color=hex_color):
+                self.assertEqual(ColorUtils.hex_to_rgb(hex_color), expected)
     
     def test_rgb_to_hex(self):
         """Test RGB to hex conversion"""
-        self.assertEqual(ColorUtils.rgb_to_hex(255, 128, 64), "#ff8040")
-        self.assertEqual(ColorUtils.rgb_to_hex(0, 0, 0), "#000000")
-        self.assertEqual(ColorUtils.rgb_to_hex(255, 255, 255), "#ffffff")
-    
-    def test_parse_color_hex(self):
-        """Test parsing hex colors"""
-        color = ColorUtils.parse_color("#ff8040")
-        self.assertEqual(color.r, 255)
-        self.assertEqual(color.g, 128)
-        self.assertEqual(color.b, 64)
-        self.assertEqual(color.a, 1.0)
-    
-    def test_parse_color_rgb_string(self):
-        """Test parsing RGB string colors"""
-        # RGB format
-        color = ColorUtils.parse_color("rgb(255, 128, 64)")
-        self.assertEqual(color.r, 255)
-        self.assertEqual(color.g, 128)
-        self.assertEqual(color.b, 64)
-        self.assertEqual(color.a, 1.0)
-        
-        # RGBA format
-        color_rgba = ColorUtils.parse_color("rgba(255, 128, 64, 0.5)")
-        self.assertEqual(color_rgba.r, 255)
-        self.assertEqual(color_rgba.g, 128)
-        self.assertEqual(color_rgba.b, 64)
-        self.assertEqual(color_rgba.a, 0.5)
-    
-    def test_parse_color_named(self):
-        """Test parsing named colors"""
-        red = ColorUtils.parse_color("red")
-        self.assertEqual(red.to_hex(), "#ff0000")
-        
-        blue = ColorUtils.parse_color("blue")
-        self.assertEqual(blue.to_hex(), "#0000ff")
-        
-        # Case insensitive
-        green = ColorUtils.parse_color("GREEN")
-        self.assertEqual(green.to_hex(), "#008000")
-    
-    def test_parse_color_tuple(self):
-        """Test parsing tuple colors"""
-        # RGB tuple
-        color = ColorUtils.parse_color((255, 128, 64))
-        self.assertEqual(color.r, 255)
-        self.assertEqual(color.g, 128)
-        self.assertEqual(color.b, 64)
-        self.assertEqual(color.a, 1.0)
-        
-        # RGBA tuple
-        color_rgba = ColorUtils.parse_color((255, 128, 64, 0.5))
-        self.assertEqual(color_rgba.a, 0.5)
+        cases = (
+            ((255, 128, 64), "#ff8040"),
+            ((0, 0, 0), "#000000"),
+            ((255, 255, 255), "#ffffff"),
+        )
+        for rgb, expected in cases:
+            with self.subTest(rgb=rgb):
+                self.assertEqual(ColorUtils.rgb_to_hex(*rgb), expected)
+    
+    def test_parse_color_cases(self):
+        """Test parsing hex, rgb()/rgba(), named and tuple colors"""
+        cases = (
+            ("#ff8040", (255, 128, 64, 1.0)),
+            ("rgb(255, 128, 64)", (255, 128, 64, 1.0)),
+            ("rgba(255, 128, 64, 0.5)", (255, 128, 64, 0.5)),
+            ("red", (255, 0, 0, 1.0)),
+            ("blue", (0, 0, 255, 1.0)),
+            ("GREEN", (0, 128, 0, 1.0)),  # Case insensitive
+            ((255, 128, 64), (255, 128, 64, 1.0)),
+            ((255, 128, 64, 0.5), (255, 128, 64, 0.5)),
+        )
+        for color_input, expected in cases:
+            with self.subTest(input=color_input):
+                self.assertRGBA(ColorUtils.parse_color(color_input), *expected)
     
     def test_parse_color_object(self):
         """Test parsing Color object"""
         original = Color(255, 128, 64, 0.8)
         parsed = ColorUtils.parse_color(original)
         
-        self.assertEqual(parsed.r, original.r)
-        self.assertEqual(parsed.g, original.g)
-        self.assertEqual(parsed.b, original.b)
-        self.assertEqual(parsed.a, original.a)
+        self.assertEqual(parsed.to_rgba_tuple(), original.to_rgba_tuple())
         self.assertIs(parsed, original)  # Should return same object
     
     def test_parse_color_invalid(self):
         """Test parsing invalid colors returns default"""
         default = ColorUtils.parse_color("invalid_color")
-        self.assertEqual(default.r, 52)  # Default blue
-        self.assertEqual(default.g, 152)
-        self.assertEqual(default.b, 219)
+        self.assertRGBA(default, 52, 152, 219)  # Default blue
     
     def test_lighten_color(self):
         """Test color lightening"""
         dark_blue = Color(52, 152, 219)
         light_blue = ColorUtils.lighten_color(dark_blue, 0.2)
         
-        self.assertGreater(light_blue.r, dark_blue.r)
-        self.assertGreater(light_blue.g, dark_blue.g)
-        self.assertGreater(light_blue.b, dark_blue.b)
+        self.assertTrue(all(l > d for l, d in zip(light_blue.to_rgb_tuple(),
+                                                  dark_blue.to_rgb_tuple())),
+                        (light_blue, dark_blue))
         
         # Test with hex string
         light_from_hex = ColorUtils.lighten_color("#3498db", 0.2)
@@ -167,48 +168,35 @@ class TestColorUtils(unittest.TestCase):
         light_blue = Color(52, 152, 219)
         dark_blue = ColorUtils.darken_color(light_blue, 0.2)
         
-        self.assertLess(dark_blue.r, light_blue.r)
-        self.assertLess(dark_blue.g, light_blue.g)
-        self.assertLess(dark_blue.b, light_blue.b)
+        self.assertTrue(all(d < l for d, l in zip(dark_blue.to_rgb_tuple(),
+                                                  light_blue.to_rgb_tuple())),
+                        (dark_blue, light_blue))
     
     def test_interpolate_colors(self):
         """Test color interpolation"""
-        red = Color(255, 0, 0)
-        blue = Color(0, 0, 255)
+        red = RED
+        blue = BLUE
         
         # Midpoint should be purple
         midpoint = ColorUtils.interpolate_colors(red, blue, 0.5)
-        self.assertEqual(midpoint.r, 127)  # (255 + 0) / 2
-        self.assertEqual(midpoint.g, 0)
-        self.assertEqual(midpoint.b, 127)  # (0 + 255) / 2
+        self.assertRGBA(midpoint, 127, 0, 127)  # channels halfway, truncated
         
         # Start point
         start = ColorUtils.interpolate_colors(red, blue, 0.0)
-        self.assertEqual(start.r, red.r)
-        self.assertEqual(start.g, red.g)
-        self.assertEqual(start.b, red.b)
+        self.assertEqual(start.to_rgb_tuple(), red.to_rgb_tuple())
         
         # End point
         end = ColorUtils.interpolate_colors(red, blue, 1.0)
-        self.assertEqual(end.r, blue.r)
-        self.assertEqual(end.g, blue.g)
-        self.assertEqual(end.b, blue.b)
+        self.assertEqual(end.to_rgb_tuple(), blue.to_rgb_tuple())
     
     def test_get_contrast_color(self):
         """Test contrast color calculation"""
-        # Light color should return black
-        white = Color(255, 255, 255)
-        contrast_white = ColorUtils.get_contrast_color(white)
-        self.assertEqual(contrast_white.to_hex(), "#000000")
-        
-        # Dark color should return white
-        black = Color(0, 0, 0)
-        contrast_black = ColorUtils.get_contrast_color(black)
-        self.assertEqual(contrast_black.to_hex(), "#ffffff")
-        
-        # Test with hex string
-        contrast_from_hex = ColorUtils.get_contrast_color("#ffffff")
-        self.assertEqual(contrast_from_hex.to_hex(), "#000000")
+        # Light color -> black, dark color -> white, hex string input
+        contrasts = tuple(
+            ColorUtils.get_contrast_color(c).to_hex()
+            for c in (Color(255, 255, 255), Color(0, 0, 0), "#ffffff")
+        )
+        self.assertEqual(contrasts, ("#000000", "#ffffff", "#000000"))
 
 class TestPoint(unittest.TestCase):
     """Tests for Point dataclass"""
@@ -221,8 +209,8 @@ class TestPoint(unittest.TestCase):
     
     def test_distance_to(self):
         """Test distance calculation"""
-        p1 = Point(0, 0)
-        p2 = Point(3, 4)
+        p1 = P_ORIGIN
+        p2 = P_3_4
         
         # Should be 5 (3-4-5 triangle)
         distance = p1.distance_to(p2)
@@ -246,9 +234,14 @@ class TestPoint(unittest.TestCase):
 class TestRectangle(unittest.TestCase):
     """Tests for Rectangle dataclass"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Rectangle shared (read-only) by the tests below"""
+        cls.RECT = Rectangle(10, 20, 100, 50)
+    
     def test_rectangle_initialization(self):
         """Test rectangle initialization"""
-        rect = Rectangle(10, 20, 100, 50)
+        rect = self.RECT
         self.assertEqual(rect.x, 10)
         self.assertEqual(rect.y, 20)
         self.assertEqual(rect.width, 100)
@@ -256,22 +249,22 @@ class TestRectangle(unittest.TestCase):
     
     def test_contains_point(self):
         """Test point containment"""
-        rect = Rectangle(10, 20, 100, 50)
+        rect = self.RECT
         
         # Point inside
-        self.assertTrue(rect.contains_point(Point(50, 40)))
+        self.assertTrue(rect.contains_point(P_IN))
         
         # Point on border
-        self.assertTrue(rect.contains_point(Point(10, 20)))
-        self.assertTrue(rect.contains_point(Point(110, 70)))
+        self.assertTrue(rect.contains_point(P_TL))
+        self.assertTrue(rect.contains_point(P_BR))
         
         # Point outside
-        self.assertFalse(rect.contains_point(Point(5, 15)))
-        self.assertFalse(rect.contains_point(Point(120, 80)))
+        self.assertFalse(rect.contains_point(P_OUT1))
+        self.assertFalse(rect.contains_point(P_OUT2))
     
     def test_center(self):
         """Test center calculation"""
-        rect = Rectangle(10, 20, 100, 50)
+        rect = self.RECT
         center = rect.center()
         
         self.assertEqual(center.x, 60)  # 10 + 100/2
@@ -279,7 +272,7 @@ class TestRectangle(unittest.TestCase):
     
     def test_area(self):
         """Test area calculation"""
-        rect = Rectangle(10, 20, 100, 50)
+        rect = self.RECT
         self.assertEqual(rect.area(), 5000)  # 100 * 50
     
     def test_intersects(self):
@@ -299,39 +292,38 @@ class TestRectangle(unittest.TestCase):
 class TestGeometryUtils(unittest.TestCase):
     """Tests for GeometryUtils class"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Rectangle shared (read-only) by the tests below"""
+        cls.RECT = Rectangle(10, 20, 100, 50)
+    
     def test_distance(self):
         """Test distance calculation"""
-        p1 = Point(0, 0)
-        p2 = Point(3, 4)
-        
-        distance = GeometryUtils.distance(p1, p2)
+        distance = GeometryUtils.distance(P_ORIGIN, P_3_4)
         self.assertEqual(distance, 5.0)
     
-    def test_clamp(self):
-        """Test value clamping"""
-        self.assertEqual(GeometryUtils.clamp(5, 0, 10), 5)
-        self.assertEqual(GeometryUtils.clamp(-5, 0, 10), 0)
-        self.assertEqual(GeometryUtils.clamp(15, 0, 10), 10)
-    
-    def test_lerp(self):
-        """Test linear interpolation"""
-        self.assertEqual(GeometryUtils.lerp(0, 10, 0.5), 5)
-        self.assertEqual(GeometryUtils.lerp(0, 10, 0), 0)
-        self.assertEqual(GeometryUtils.lerp(0, 10, 1), 10)
-    
-    def test_map_range(self):
-        """Test range mapping"""
-        # Map 5 from range [0,10] to range [0,100]
-        result = GeometryUtils.map_range(5, 0, 10, 0, 100)
-        self.assertEqual(result, 50)
-        
-        # Map 2 from range [0,4] to range [10,20]
-        result = GeometryUtils.map_range(2, 0, 4, 10, 20)
-        self.assertEqual(result, 15)
+    def test_scalar_ops(self):
+        """Test clamp, lerp and map_range"""
+        cases = (
+            # Value clamping
+            (GeometryUtils.clamp, (5, 0, 10), 5),
+            (GeometryUtils.clamp, (-5, 0, 10), 0),
+            (GeometryUtils.clamp, (15, 0, 10), 10),
+            # Linear interpolation
+            (GeometryUtils.lerp, (0, 10, 0.5), 5),
+            (GeometryUtils.lerp, (0, 10, 0), 0),
+            (GeometryUtils.lerp, (0, 10, 1), 10),
+            # Map 5 from [0,10] to [0,100], and 2 from [0,4] to [10,20]
+            (GeometryUtils.map_range, (5, 0, 10, 0, 100), 50),
+            (GeometryUtils.map_range, (2, 0, 4, 10, 20), 15),
+        )
+        for fn, args, expected in cases:
+            with self.subTest(fn=fn.__name__, args=args):
+                self.assertEqual(fn(*args), expected)
     
     def test_round_rectangle_path_zero_radius(self):
         """Test rounded rectangle with zero radius"""
-        rect = Rectangle(10, 20, 100, 50)
+        rect = self.RECT
         points = GeometryUtils.round_rectangle_path(rect, 0)
         
         # Should have 4 corners
@@ -343,15 +335,20 @@ class TestGeometryUtils(unittest.TestCase):
     
     def test_round_rectangle_path_with_radius(self):
         """Test rounded rectangle with radius"""
-        rect = Rectangle(10, 20, 100, 50)
+        rect = self.RECT
+        # Each corner contributes segments + 1 points (8 segments by default)
         points = GeometryUtils.round_rectangle_path(rect, 10)
+        self.assertEqual(len(points), 4 * (8 + 1))
         
-        # Should have multiple points for rounded corners
-        self.assertGreater(len(points), 4)
+        points = GeometryUtils.round_rectangle_path(rect, 10, segments=4)
+        self.assertEqual(len(points), 4 * (4 + 1))
+        
+        with self.assertRaises(ValueError):
+            GeometryUtils.round_rectangle_path(rect, 10, segments=0)
     
     def test_calculate_bezier_point(self):
         """Test Bezier curve calculation"""
-        p0 = Point(0, 0)
+        p0 = P_ORIGIN
         p1 = Point(0, 10)
         p2 = Point(10, 10)
         p3 = Point(10, 0)
@@ -373,38 +370,36 @@ class TestGeometryUtils(unittest.TestCase):
         
         # Negative angle
         normalized = GeometryUtils.normalize_angle(-math.pi)
-        self.assertAlmostEqual(normalized, math.pi, places=10)
+        self.assertTrue(isclose(normalized, math.pi, abs_tol=1e-10), (normalized, math.pi))
         
         # Angle > 2π
         normalized = GeometryUtils.normalize_angle(3 * math.pi)
-        self.assertAlmostEqual(normalized, math.pi, places=10)
+        self.assertTrue(isclose(normalized, math.pi, abs_tol=1e-10), (normalized, math.pi))
     
     def test_degrees_radians_conversion(self):
         """Test angle conversion"""
         # 180 degrees = π radians
         radians = GeometryUtils.degrees_to_radians(180)
-        self.assertAlmostEqual(radians, math.pi, places=10)
+        self.assertTrue(isclose(radians, math.pi, abs_tol=1e-10), (radians, math.pi))
         
         # π radians = 180 degrees
         degrees = GeometryUtils.radians_to_degrees(math.pi)
-        self.assertAlmostEqual(degrees, 180, places=10)
+        self.assertTrue(isclose(degrees, 180, abs_tol=1e-10), (degrees, 180))
 
 class TestColorPalettes(unittest.TestCase):
     """Tests for ColorPalettes class"""
     
     def test_palette_contents(self):
         """Test that palettes contain expected colors"""
-        # Material Design palette
-        self.assertIn('blue', ColorPalettes.MATERIAL_DESIGN)
-        self.assertEqual(ColorPalettes.MATERIAL_DESIGN['blue'], '#2196F3')
-        
-        # Flat UI palette
-        self.assertIn('turquoise', ColorPalettes.FLAT_UI)
-        self.assertEqual(ColorPalettes.FLAT_UI['turquoise'], '#1ABC9C')
-        
-        # Bootstrap palette
-        self.assertIn('primary', ColorPalettes.BOOTSTRAP)
-        self.assertEqual(ColorPalettes.BOOTSTRAP['primary'], '#007bff')
+        cases = (
+            ("MATERIAL_DESIGN", "blue", "#2196F3"),
+            ("FLAT_UI", "turquoise", "#1ABC9C"),
+            ("BOOTSTRAP", "primary", "#007bff"),
+        )
+        for palette_name, key, expected in cases:
+            with self.subTest(palette=palette_name):
+                palette = getattr(ColorPalettes, palette_name)
+                self.assertEqual(palette.get(key), expected)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file